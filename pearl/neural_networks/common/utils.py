@@ -5,8 +5,10 @@
 # LICENSE file in the root directory of this source tree.
 #
 
+import functools
 import logging
-from typing import Any, Dict, List, Optional, Union
+import re
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import torch
 import torch.nn as nn
@@ -55,7 +57,11 @@ def mlp_block(
     if hidden_dims is None:
         hidden_dims = []
     dims = [input_dim] + hidden_dims + [output_dim]
+    # layers are added to a single flat nn.Sequential; only layer groups that get a
+    # skip connection are wrapped (in a ResidualWrapper)
     layers = []
+    # (index in `layers`, wrapped in a ResidualWrapper) of each layer group
+    layer_groups = []
     for i in range(len(dims) - 2):
         single_layers = []
         input_dim_current_layer = dims[i]
@@ -67,38 +73,110 @@ def mlp_block(
             single_layers.append(nn.LayerNorm(output_dim_current_layer))
         if dropout_ratio > 0:
             single_layers.append(nn.Dropout(p=dropout_ratio))
-        single_layers.append(ACTIVATION_MAP[hidden_activation]())
+        if hidden_activation == "relu":
+            # in place, since the preceding layers do not need their output for backward
+            single_layers.append(nn.ReLU(inplace=True))
+        else:
+            single_layers.append(ACTIVATION_MAP[hidden_activation]())
         if use_batch_norm:
             single_layers.append(nn.BatchNorm1d(output_dim_current_layer))
-        single_layer_model = nn.Sequential(*single_layers)
-        if use_skip_connections:
-            if input_dim_current_layer == output_dim_current_layer:
-                single_layer_model = ResidualWrapper(single_layer_model)
-            else:
-                logging.warn(
-                    "Skip connections are enabled, "
-                    f"but layer in_dim ({input_dim_current_layer}) != out_dim "
-                    f"({output_dim_current_layer})."
-                    "Skip connection will not be added for this layer"
-                )
-        layers.append(single_layer_model)
+        layer_groups.append(
+            (
+                len(layers),
+                _append_layer_group(
+                    layers,
+                    single_layers,
+                    input_dim_current_layer,
+                    output_dim_current_layer,
+                    use_skip_connections,
+                ),
+            )
+        )
 
     last_layer = []
     last_layer.append(nn.Linear(dims[-2], dims[-1]))
     if last_activation is not None:
         last_layer.append(ACTIVATION_MAP[last_activation]())
-    last_layer_model = nn.Sequential(*last_layer)
-    if use_skip_connections:
-        if dims[-2] == dims[-1]:
-            last_layer_model = ResidualWrapper(last_layer_model)
+    layer_groups.append(
+        (
+            len(layers),
+            _append_layer_group(
+                layers, last_layer, dims[-2], dims[-1], use_skip_connections
+            ),
+        )
+    )
+    model = nn.Sequential(*layers)
+    # state dicts saved when every layer group was its own nn.Sequential
+    # are loaded into the flat layout
+    model._register_load_state_dict_pre_hook(
+        functools.partial(_remap_nested_mlp_block_keys, layer_groups)
+    )
+    return model
+
+
+def _append_layer_group(
+    layers: List[nn.Module],
+    layer_group: List[nn.Module],
+    input_dim: int,
+    output_dim: int,
+    use_skip_connection: bool,
+) -> bool:
+    """
+    Appends a group of layers to `layers`, wrapped in a ResidualWrapper if a skip
+    connection is requested and possible, and as individual layers otherwise.
+    Returns:
+        whether the group was wrapped in a ResidualWrapper
+    """
+    if use_skip_connection:
+        if input_dim == output_dim:
+            layers.append(ResidualWrapper(nn.Sequential(*layer_group)))
+            return True
+        logging.warn(
+            "Skip connections are enabled, "
+            f"but layer in_dim ({input_dim}) != out_dim ({output_dim}). "
+            "Skip connection will not be added for this layer"
+        )
+    layers.extend(layer_group)
+    return False
+
+
+def _remap_nested_mlp_block_keys(
+    layer_groups: List[Tuple[int, bool]],
+    state_dict: Dict[str, Any],
+    prefix: str,
+    *args: Any,
+) -> None:
+    """
+    Load state dict pre-hook of `mlp_block`, renaming in place the keys of a state
+    dict saved with one nn.Sequential per layer group (`<group>.<layer>.<name>` and
+    `<group>.module.<layer>.<name>`) to the flat layout
+    (`<index>.<name>` and `<index>.module.<layer>.<name>`).
+    Args:
+        layer_groups: (index in the flat nn.Sequential, wrapped in a
+            ResidualWrapper) of each layer group
+        state_dict: state dict being loaded
+        prefix: prefix of the keys of the mlp_block in state_dict
+    """
+    # only the nested layout has keys `<group>.<layer>.<name>`, since wrapped
+    # groups are `<index>.module.<layer>.<name>` in both layouts
+    nested_key = re.compile(re.escape(prefix) + r"(\d+)\.(\d+|module)\.(.*)")
+    matches = [(key, nested_key.fullmatch(key)) for key in state_dict]
+    if not any(match is not None and match[2] != "module" for _, match in matches):
+        return
+    # collected first, since a renamed key can be the old key of a later group
+    renamed = {}
+    for key, match in matches:
+        if match is None or int(match[1]) >= len(layer_groups):
+            continue
+        index, wrapped = layer_groups[int(match[1])]
+        if wrapped:
+            new_key = f"{prefix}{index}.module.{match[3]}"
+        elif match[2] != "module":
+            new_key = f"{prefix}{index + int(match[2])}.{match[3]}"
         else:
-            logging.warn(
-                "Skip connections are enabled, "
-                f"but layer in_dim ({dims[-2]}) != out_dim ({dims[-1]}). "
-                "Skip connection will not be added for this layer"
-            )
-    layers.append(last_layer_model)
-    return nn.Sequential(*layers)
+            continue
+        renamed[new_key] = state_dict.pop(key)
+    state_dict.update(renamed)
 
 
 def conv_block(
@@ -146,6 +224,16 @@ def conv_block(
     return nn.Sequential(*layers)
 
 
+def compile_in_place(module: nn.Module, use_torch_compile: bool) -> None:
+    """
+    Compiles `module` with `torch.compile` if `use_torch_compile` is set.
+    The module is compiled in place, so that its parameter names and state dict
+    are unchanged, and compilation happens lazily on its first forward pass.
+    """
+    if use_torch_compile:
+        module.compile()
+
+
 # TODO: the name of this function needs to be revised to xavier_init_weights
 def init_weights(m: nn.Module) -> None:
     if isinstance(m, nn.Linear):
@@ -163,6 +251,20 @@ def update_target_network(
     target_network: nn.Module, source_network: nn.Module, tau: float
 ) -> None:
     # Q_target = (1 - tao) * Q_target + tao*Q
+    target_params, source_params = _soft_update_param_pairs(
+        target_network, source_network
+    )
+    _soft_update_params(target_params, source_params, tau)
+
+
+def _soft_update_param_pairs(
+    target_network: nn.Module, source_network: nn.Module
+) -> Tuple[List[torch.Tensor], List[torch.Tensor]]:
+    """
+    Returns the lists of target and source parameter tensors to soft-update.
+    """
+    target_params = []
+    source_params = []
     for target_param, source_param in zip(
         target_network.parameters(), source_network.parameters()
     ):
@@ -170,8 +272,17 @@ def update_target_network(
             # skip soft-updating when the target network shares the parameter with
             # the network being train.
             continue
-        new_param = tau * source_param.data + (1.0 - tau) * target_param.data
-        target_param.data.copy_(new_param)
+        target_params.append(target_param.data)
+        source_params.append(source_param.data)
+    return target_params, source_params
+
+
+def _soft_update_params(
+    target_params: List[torch.Tensor], source_params: List[torch.Tensor], tau: float
+) -> None:
+    if len(target_params) > 0:
+        # a single multi-tensor kernel instead of one update per parameter
+        torch._foreach_lerp_(target_params, source_params, tau)
 
 
 def ensemble_forward(
@@ -237,7 +348,15 @@ def update_target_networks(
         tau: parameter for soft update
     """
     # Q_target = (1 - tao) * Q_target + tao*Q
+    # parameters of all networks are updated together in one foreach call
+    all_target_params = []
+    all_source_params = []
     for target_network, source_network in zip(
         list_of_target_networks, list_of_source_networks
     ):
-        update_target_network(target_network, source_network, tau)
+        target_params, source_params = _soft_update_param_pairs(
+            target_network, source_network
+        )
+        all_target_params.extend(target_params)
+        all_source_params.extend(source_params)
+    _soft_update_params(all_target_params, all_source_params, tau)
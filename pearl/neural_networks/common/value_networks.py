@@ -26,7 +26,7 @@ from pearl.utils.functional_utils.learning.extend_state_feature import (
 )
 from torch import Tensor
 
-from .utils import conv_block, mlp_block
+from .utils import compile_in_place, conv_block, mlp_block
 
 
 class ValueNetwork(nn.Module, ABC):
@@ -39,11 +39,24 @@ class ValueNetwork(nn.Module, ABC):
 
 
 class VanillaValueNetwork(ValueNetwork):
+    """
+    A vanilla value network consisting of an mlp block.
+    Args:
+        input_dim: dimension of the input
+        hidden_dims: a list of dimensions of the hidden layers
+        output_dim: dimension of the output layer
+        use_torch_compile: whether to compile the mlp block with `torch.compile`,
+            which fuses consecutive layers into fewer kernels. Compilation happens
+            lazily on the first forward pass (and again for new input shapes).
+        kwargs: additional arguments passed to `mlp_block`
+    """
+
     def __init__(
         self,
         input_dim: int,
         hidden_dims: Optional[List[int]],
         output_dim: int = 1,
+        use_torch_compile: bool = False,
         **kwargs: Any,
     ) -> None:
         super(VanillaValueNetwork, self).__init__()
@@ -53,6 +66,7 @@ class VanillaValueNetwork(ValueNetwork):
             output_dim=output_dim,
             **kwargs,
         )
+        compile_in_place(self._model, use_torch_compile)
 
     def forward(self, x: Tensor) -> Tensor:
         return self._model(x)
@@ -230,6 +244,9 @@ class VanillaQValueNetwork(QValueNetwork):
     A vanilla version of state-action value (Q-value) network.
     It leverages the vanilla implementation of value networks by
     using the state-action pair as the input for the value network.
+    If `use_torch_compile` is True, the mlp block is compiled with `torch.compile`,
+    so that its Linear and activation layers run as a few fused kernels instead of
+    one kernel launch per layer.
     """
 
     def __init__(
@@ -239,6 +256,7 @@ class VanillaQValueNetwork(QValueNetwork):
         hidden_dims: List[int],
         output_dim: int,
         use_layer_norm: bool = False,
+        use_torch_compile: bool = False,
     ) -> None:
         super(VanillaQValueNetwork, self).__init__()
         self._state_dim: int = state_dim
@@ -249,6 +267,7 @@ class VanillaQValueNetwork(QValueNetwork):
             output_dim=output_dim,
             use_layer_norm=use_layer_norm,
         )
+        compile_in_place(self._model, use_torch_compile)
 
     def forward(self, x: Tensor) -> Tensor:
         return self._model(x)
@@ -362,6 +381,10 @@ class DuelingQValueNetwork(QValueNetwork):
     state --> state_arch -----> value_arch --> value(s)-----------------------\
                                 |                                              ---> add --> Q(s,a)
     action ------------concat-> advantage_arch --> advantage(s, a)--- -mean --/
+
+    If `use_torch_compile` is True, the whole forward pass is compiled with
+    `torch.compile`, which fuses the concatenation and the mean-subtraction epilogue
+    with the three mlps.
     """
 
     def __init__(
@@ -373,6 +396,7 @@ class DuelingQValueNetwork(QValueNetwork):
         value_hidden_dims: Optional[List[int]] = None,
         advantage_hidden_dims: Optional[List[int]] = None,
         state_hidden_dims: Optional[List[int]] = None,
+        use_torch_compile: bool = False,
     ) -> None:
         super(DuelingQValueNetwork, self).__init__()
         self._state_dim: int = state_dim
@@ -400,6 +424,7 @@ class DuelingQValueNetwork(QValueNetwork):
             else advantage_hidden_dims,
             output_dim=output_dim,  # output_dim=1
         )
+        compile_in_place(self, use_torch_compile)
 
     @property
     def state_dim(self) -> int:
@@ -461,8 +486,10 @@ class DuelingQValueNetwork(QValueNetwork):
         TODO: assumes a gym environment interface with fixed action space, change it with masking
         """
 
+        # the forward passes go through __call__, so that they are compiled
+        # when use_torch_compile is set
         if curr_available_actions_batch is None:
-            return self.forward(state_batch, action_batch).view(-1)
+            return self(state_batch, action_batch).view(-1)
         else:
             # calculate the q value of all available actions
             state_repeated_batch = extend_state_feature_by_available_action_space(
@@ -471,7 +498,7 @@ class DuelingQValueNetwork(QValueNetwork):
             )  # shape: (batch_size, available_action_space_size, state_dim)
 
             # collect Q values of a state and all available actions
-            values_state_available_actions = self.forward(
+            values_state_available_actions = self(
                 state_repeated_batch, curr_available_actions_batch
             )  # shape: (batch_size, available_action_space_size, action_dim)
 
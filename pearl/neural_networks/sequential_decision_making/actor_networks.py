@@ -14,6 +14,7 @@ from typing import List, Optional, Tuple, Union
 
 import torch
 import torch.nn as nn
+import torch.nn.functional as F
 
 from pearl.api.action_space import ActionSpace
 from pearl.neural_networks.common.utils import mlp_block
@@ -108,15 +109,24 @@ class VanillaActorNetwork(ActorNetwork):
         super(VanillaActorNetwork, self).__init__(
             input_dim, hidden_dims, output_dim, action_space
         )
+        # the softmax is applied in `forward`, so that the logits remain available
         self._model: nn.Module = mlp_block(
             input_dim=input_dim,
             hidden_dims=hidden_dims,
             output_dim=output_dim,
-            last_activation="softmax",
         )
 
-    def forward(self, x: torch.Tensor) -> torch.Tensor:
-        return self._model(x)
+    def forward(self, x: torch.Tensor, return_logits: bool = False) -> torch.Tensor:
+        """
+        Args:
+            x: batch of states with shape (batch_size, input_dim) or (input_dim)
+            return_logits: if True, return the pre-softmax logits
+                instead of the action probabilities.
+        """
+        logits = self._model(x)
+        if return_logits:
+            return logits
+        return torch.softmax(logits, dim=-1)
 
     def get_policy_distribution(
         self,
@@ -160,6 +170,32 @@ class VanillaActorNetwork(ActorNetwork):
 
         return action_probs.view(-1)
 
+    def get_log_action_prob(
+        self,
+        state_batch: torch.Tensor,
+        action_batch: torch.Tensor,
+        available_actions: Optional[torch.Tensor] = None,
+        unavailable_actions_mask: Optional[torch.Tensor] = None,
+    ) -> torch.Tensor:
+        """
+        Gets log probabilities of different actions from a discrete actor network.
+        Computed from the logits with a fused log-softmax (cross entropy),
+        which is more stable than taking the log of `get_action_prob`.
+        Assumes that the input batch of actions is one-hot encoded.
+
+        Args:
+            state_batch: batch of states with shape (batch_size, input_dim)
+            action_batch: batch of actions with shape (batch_size, output_dim)
+        Returns:
+            log_action_probs: log probabilities of each action in the batch
+                with shape (batch_size)
+        """
+        logits = self.forward(
+            state_batch, return_logits=True
+        )  # shape: (batch_size, output_dim)
+        action_idx = torch.argmax(action_batch, dim=1)  # one_hot to decimal
+        return -F.cross_entropy(logits, action_idx, reduction="none")
+
 
 class DynamicActionActorNetwork(VanillaActorNetwork):
     def __init__(
@@ -188,7 +224,14 @@ class DynamicActionActorNetwork(VanillaActorNetwork):
             last_activation="linear",
         )
 
-    def forward(self, x: torch.Tensor) -> torch.Tensor:
+    def forward(self, x: torch.Tensor, return_logits: bool = False) -> torch.Tensor:
+        """
+        Args:
+            x: batch of state-action pairs with shape (..., input_dim)
+            return_logits: accepted for compatibility with `VanillaActorNetwork`.
+                The output is always the logit of each state-action pair, since the
+                softmax is taken over the available actions of each state.
+        """
         return self._model(x)
 
     def get_policy_distribution(
@@ -257,6 +300,65 @@ class DynamicActionActorNetwork(VanillaActorNetwork):
                 (batch_size, max_number_actions) or (max_number_actions)
         Returns:
             action_probs: probabilities of each action in the batch with shape (batch_size)
+            An action which matches no available action (or only unavailable ones)
+            gets probability 0, and an action which matches several available
+            actions gets the sum of their probabilities.
+        """
+        all_action_logits, all_equal = self._get_action_logits_and_mask(
+            state_batch, action_batch, available_actions, unavailable_actions_mask
+        )
+        action_probs_for_all = torch.softmax(
+            all_action_logits, dim=-1
+        )  # shape: (batch_size, max_number_actions)
+        # select the probability of the matching action with the boolean mask itself,
+        # which avoids materializing an index tensor of data-dependent length
+        action_probs = torch.sum(
+            action_probs_for_all * all_equal, dim=1
+        )  # shape: (batch_size)
+
+        return action_probs.view(-1)
+
+    def get_log_action_prob(
+        self,
+        state_batch: torch.Tensor,
+        action_batch: torch.Tensor,
+        available_actions: Optional[torch.Tensor] = None,
+        unavailable_actions_mask: Optional[torch.Tensor] = None,
+    ) -> torch.Tensor:
+        """
+        Gets log probabilities of different actions from a discrete actor network in a
+        dynamic action space, using a log-softmax over the logits of all available actions.
+        See `get_action_prob` for the arguments.
+        Returns:
+            log_action_probs: log probabilities of each action in the batch
+                with shape (batch_size)
+        """
+        all_action_logits, all_equal = self._get_action_logits_and_mask(
+            state_batch, action_batch, available_actions, unavailable_actions_mask
+        )
+        log_action_probs_for_all = torch.log_softmax(
+            all_action_logits, dim=-1
+        )  # shape: (batch_size, max_number_actions)
+        # `where` rather than a product, since unavailable actions have -inf log probs.
+        # as in `get_action_prob`, unmatched actions get probability 0 (log prob -inf)
+        # and actions with several matches get the sum of their probabilities
+        log_action_probs = torch.logsumexp(
+            torch.where(all_equal, log_action_probs_for_all, -float("inf")), dim=1
+        )  # shape: (batch_size)
+
+        return log_action_probs.view(-1)
+
+    def _get_action_logits_and_mask(
+        self,
+        state_batch: torch.Tensor,
+        action_batch: torch.Tensor,
+        available_actions: Optional[torch.Tensor],
+        unavailable_actions_mask: Optional[torch.Tensor],
+    ) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        Computes the logits of all available actions, with unavailable actions set to -inf,
+        and the mask of the action of each batch element among the available actions.
+        Both outputs have shape (batch_size, max_number_actions).
         """
         assert available_actions is not None
 
@@ -268,7 +370,7 @@ class DynamicActionActorNetwork(VanillaActorNetwork):
             if len(available_actions.shape) == 2
             else available_actions
         )  # shape (batch_size, max_number_actions, action_dim)
-        # Find the corresponding action index from available_action_spaces_batch
+        # Find the mask of the corresponding action in available_action_spaces_batch
         # Note that we need to find the idx here because action indices are not permanent
         actions_expanded = action_batch.unsqueeze(
             1
@@ -282,28 +384,16 @@ class DynamicActionActorNetwork(VanillaActorNetwork):
                 all_equal, torch.logical_not(unavailable_actions_mask)
             )  # shape (batch_size, max_number_actions)
 
-        action_idx = all_equal.nonzero(as_tuple=True)[1].reshape(
-            -1, 1
-        )  # shape (batch_size)
-
         state_repeated = state_batch.unsqueeze(1).repeat(
             1, available_actions_batch.shape[1], 1
         )  # shape (batch_size, max_number_actions, state_dim)
         input_batch = torch.cat((state_repeated, available_actions_batch), dim=-1)
-        all_action_probs = self.forward(input_batch).view(
+        all_action_logits = self.forward(input_batch).view(
             (batch_size, -1)
         )  # shape: (batch_size, max_number_actions)
         if unavailable_actions_mask is not None:
-            all_action_probs[unavailable_actions_mask] = -float("inf")
-
-        action_probs_for_all = torch.softmax(
-            all_action_probs, dim=-1
-        )  # shape: (batch_size, max_number_actions)
-        action_probs = action_probs_for_all.gather(
-            1, action_idx
-        )  # shape: (batch_size, 1)
-
-        return action_probs.view(-1)
+            all_action_logits[unavailable_actions_mask] = -float("inf")
+        return all_action_logits, all_equal
 
 
 class VanillaContinuousActorNetwork(ActorNetwork):
@@ -34,7 +34,7 @@ from pearl.safety_modules.identity_safety_module import IdentitySafetyModule
 from pearl.safety_modules.risk_sensitive_safety_modules import RiskNeutralSafetyModule
 from pearl.safety_modules.safety_module import SafetyModule
 from pearl.utils.compatibility_checks import pearl_agent_compatibility_check
-from pearl.utils.device import get_pearl_device
+from pearl.utils.device import as_tensor_on_device, get_pearl_device
 from pearl.utils.instantiations.spaces.discrete_action import DiscreteActionSpace
 
 
@@ -136,7 +136,7 @@ class PearlAgent(Agent):
         # PolicyLearner requires all tensor inputs to be already on the correct device
         # before being passed to it.
         subjective_state_to_be_used = (
-            torch.as_tensor(self._subjective_state).to(self.device)
+            as_tensor_on_device(self._subjective_state, self.device)
             if self.policy_learner.requires_tensors  # temporary fix before abstract interfaces
             else self._subjective_state
         )
@@ -240,11 +240,11 @@ class PearlAgent(Agent):
         if self._latest_action is not None:
             latest_action_representation = (
                 self.policy_learner.action_representation_module(
-                    torch.as_tensor(self._latest_action).unsqueeze(0).to(self.device)
+                    as_tensor_on_device(self._latest_action, self.device).unsqueeze(0)
                 )
             )
         observation_to_be_used = (
-            torch.as_tensor(observation).to(self.device)
+            as_tensor_on_device(observation, self.device)
             if self.policy_learner.requires_tensors  # temporary fix before abstract interfaces
             else observation
         )
@@ -77,6 +77,16 @@ class DisjointBanditContainer(ContextualBanditBase):
         """
         Break input batch down into per-arm batches based on action
         """
+        if batch.state.ndim == 3:
+            # shape: (batch_size, num_arms, feature_size)
+            # different features for each arm
+            assert (
+                batch.state.shape[1] == self.n_arms
+            ), "For 3D state, 2nd dimension must be equal to number of arms"
+        # default weights are built once for the whole batch and masked per arm
+        weight = (
+            batch.weight if batch.weight is not None else torch.ones_like(batch.reward)
+        )
         batches = []
         for arm in range(self.n_arms):
             # mask of observations for this arm
@@ -85,31 +95,20 @@ class DisjointBanditContainer(ContextualBanditBase):
             if batch.state.ndim == 2:
                 # shape: (batch_size, feature_size)
                 # same features for all arms
-                state = batch.state
+                state = batch.state[mask]
             elif batch.state.ndim == 3:
-                # shape: (batch_size, num_arms, feature_size)
-                # different features for each arm
-                assert (
-                    batch.state.shape[1] == self.n_arms
-                ), "For 3D state, 2nd dimension must be equal to number of arms"
-                state = batch.state[:, arm, :]
+                state = batch.state[:, arm, :][mask]
+            # all tensors are already on batch.device, so no .to() is needed
             batches.append(
                 TransitionBatch(
-                    state=state[mask],
+                    state=state,
                     reward=batch.reward[mask],
-                    weight=batch.weight[mask]
-                    if batch.weight is not None
-                    else torch.ones_like(mask, dtype=torch.float),
+                    weight=weight[mask],
                     # empty action features since disjoint model used
                     # action as index of per-arm model
                     # if arms need different features, use 3D `state` instead
-                    action=torch.empty(
-                        int(mask.sum().item()),
-                        0,
-                        dtype=torch.float,
-                        device=batch.device,
-                    ),
-                ).to(batch.device)
+                    action=state.new_empty(state.shape[0], 0, dtype=torch.float),
+                )
             )
         return batches
 
@@ -15,7 +15,6 @@ from pearl.api.action import Action
 from pearl.history_summarization_modules.history_summarization_module import (
     SubjectiveState,
 )
-from pearl.neural_networks.common.utils import ensemble_forward
 from pearl.policy_learners.contextual_bandits.contextual_bandit_base import (
     ContextualBanditBase,
 )
@@ -60,7 +59,7 @@ class DisjointLinearBandit(ContextualBanditBase):
         )
         # Currently our disjoint LinUCB usecase only use LinearRegression
 
-        # Keep list attribute since ensemble_forward requires List[nn.Module]
+        # Keep list attribute since batch_forward requires a list of models
         self._linear_regressions_list: List[nn.Module] = [
             LinearRegression(feature_dim=feature_dim, l2_reg_lambda=l2_reg_lambda)
             for _ in range(action_space.n)
@@ -69,6 +68,14 @@ class DisjointLinearBandit(ContextualBanditBase):
         self._linear_regressions = nn.ModuleList(self._linear_regressions_list)
         self._discrete_action_space = action_space
         self._state_features_only = state_features_only
+        # (action_count, action_dim) tensor of action features, built once here
+        # so learn_batch does not rebuild it from the action space on every batch.
+        # Registered as a buffer so it follows the policy learner across devices.
+        self.register_buffer(
+            "_action_features",
+            action_space.actions_batch.float(),
+            persistent=False,
+        )
 
     def learn_batch(self, batch: TransitionBatch) -> Dict[str, Any]:
         """
@@ -76,44 +83,44 @@ class DisjointLinearBandit(ContextualBanditBase):
         batch is action idx instead of action value
         Only discrete action problem will use DisjointLinearBandit
         """
-        for action_idx, linear_regression in enumerate(self._linear_regressions):
-            index = torch.nonzero(batch.action == action_idx, as_tuple=True)[0]
-            if index.numel() == 0:
-                continue
-            state = torch.index_select(
-                batch.state,
-                dim=0,
-                index=index,
-            )
-            if self._state_features_only:
-                context = state
-            else:
-                # cat state with corresponding action tensor
-                expanded_action = (
-                    torch.Tensor(self._discrete_action_space[action_idx])
-                    .unsqueeze(0)
-                    .expand(state.shape[0], -1)
-                    .to(batch.device)
-                )
-                context = torch.cat([state, expanded_action], dim=1)
-            reward = torch.index_select(
-                batch.reward,
-                dim=0,
-                index=index,
-            )
-            if batch.weight is not None:
-                weight = torch.index_select(
-                    batch.weight,
-                    dim=0,
-                    index=index,
-                )
-            else:
-                weight = torch.ones(reward.shape, device=batch.device)
-            linear_regression.learn_batch(
-                x=context,
-                y=reward,
-                weight=weight,
-            )
+        # sufficient statistics of all arms are computed in one pass over the batch
+        # and scattered to the arm each sample was routed to
+        action_idx = batch.action.view(-1).long()  # (batch_size,)
+        n_arms = len(self._linear_regressions)
+        if self._state_features_only:
+            context = batch.state
+        else:
+            # cat state with the action tensor of the corresponding arm
+            context = torch.cat([batch.state, self._action_features[action_idx]], dim=1)
+        x = LinearRegression.append_ones(context)  # (batch_size, feature_dim + 1)
+        weight = (
+            batch.weight if batch.weight is not None else torch.ones_like(batch.reward)
+        )
+        weighted_x = x * weight.unsqueeze(1)
+
+        dim = x.shape[1]
+        delta_A = torch.zeros(n_arms, dim, dim, device=batch.device).index_add_(
+            0, action_idx, torch.einsum("bi,bj->bij", weighted_x, x)
+        )
+        delta_b = torch.zeros(n_arms, dim, device=batch.device).index_add_(
+            0, action_idx, weighted_x * batch.reward.unsqueeze(1)
+        )
+        delta_sum_weight = torch.zeros(n_arms, device=batch.device).index_add_(
+            0, action_idx, weight
+        )
+        # single host sync to skip arms without observations in this batch
+        arm_counts = torch.bincount(action_idx, minlength=n_arms).tolist()
+        updated_arm_list = [i for i, count in enumerate(arm_counts) if count > 0]
+        updated_arms = torch.tensor(
+            updated_arm_list, dtype=torch.long, device=batch.device
+        )  # (num_updated_arms,)
+        # all updated arms are solved together in one batched inversion
+        LinearRegression.batch_update_from_stats(
+            models=[self._linear_regressions[i] for i in updated_arm_list],
+            delta_A=delta_A[updated_arms],
+            delta_b=delta_b[updated_arms],
+            delta_sum_weight=delta_sum_weight[updated_arms],
+        )
 
         return {}
 
@@ -133,9 +140,11 @@ class DisjointLinearBandit(ContextualBanditBase):
         )
         # (batch_size, action_count, feature_size)
 
-        values = ensemble_forward(
-            self._linear_regressions_list, feature, use_for_loop=True
-        )
+        # all arms are evaluated with one batched product of their coefficients
+        values = LinearRegression.batch_forward(
+            self._linear_regressions_list,  # pyre-fixme[6]: all are LinearRegression
+            feature,
+        )  # (batch_size, action_count)
         return self._exploration_module.act(
             subjective_state=feature,
             action_space=action_space,
@@ -8,6 +8,7 @@
 from typing import Any, Dict, List, Optional
 
 import torch
+import torch.nn.functional as F
 
 from pearl.api.action import Action
 from pearl.api.action_space import ActionSpace
@@ -61,7 +62,10 @@ class NeuralBandit(ContextualBanditBase):
             **kwargs,
         )
         self._optimizer: torch.optim.Optimizer = optim.AdamW(
-            self._deep_represent_layers.parameters(), lr=learning_rate, amsgrad=True
+            self._deep_represent_layers.parameters(),
+            lr=learning_rate,
+            amsgrad=True,
+            foreach=True,
         )
         self._state_features_only = state_features_only
 
@@ -75,8 +79,7 @@ class NeuralBandit(ContextualBanditBase):
         current_values = self._deep_represent_layers(input_features)
         expected_values = batch.reward
 
-        criterion = torch.nn.MSELoss()
-        loss = criterion(current_values.view(expected_values.shape), expected_values)
+        loss = F.mse_loss(current_values.view(expected_values.shape), expected_values)
 
         # Optimize the deep layer
         self._optimizer.zero_grad()
@@ -113,7 +116,8 @@ class NeuralBandit(ContextualBanditBase):
             action_space=action_space,
             state_features_only=self._state_features_only,
         )
-        values = self._deep_represent_layers(new_feature).squeeze()
+        with torch.no_grad():
+            values = self._deep_represent_layers(new_feature).squeeze()
         # batch_size * action_count
         assert values.numel() == new_feature.shape[0] * action_count
         return self._exploration_module.act(
@@ -158,9 +158,12 @@ class PolicyLearner(torch.nn.Module, ABC):
         Returns:
             A dictionary which includes useful metrics
         """
-        batch_size = self._batch_size if not self.on_policy else len(replay_buffer)
+        if replay_buffer.is_empty:
+            return {}
 
-        if len(replay_buffer) < batch_size or len(replay_buffer) == 0:
+        replay_buffer_size = len(replay_buffer)
+        batch_size = self._batch_size if not self.on_policy else replay_buffer_size
+        if replay_buffer_size < batch_size:
             return {}
 
         report = {}
@@ -129,7 +129,8 @@ class ActorCriticBase(PolicyLearner):
                     "lr": actor_learning_rate,
                     "amsgrad": True,
                 },
-            ]
+            ],
+            foreach=True,  # multi-tensor updates, for this and the critic optimizer
         )
         self._actor_soft_update_tau = actor_soft_update_tau
         if self._use_actor_target:
@@ -161,7 +162,8 @@ class ActorCriticBase(PolicyLearner):
                         "lr": critic_learning_rate,
                         "amsgrad": True,
                     },
-                ]
+                ],
+                foreach=True,
             )
             if self._use_critic_target:
                 self._critic_target: nn.Module = make_critic(
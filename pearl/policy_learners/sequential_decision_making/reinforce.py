@@ -5,6 +5,7 @@
 # LICENSE file in the root directory of this source tree.
 #
 
+import math
 from typing import Any, Dict, List, Optional, Type
 
 from pearl.action_representation_modules.action_representation_module import (
@@ -39,6 +40,9 @@ from pearl.policy_learners.sequential_decision_making.actor_critic_base import (
 from pearl.replay_buffers.transition import TransitionBatch
 
 
+LOG_PROB_FLOOR: float = math.log(1e-8)
+
+
 class REINFORCE(ActorCriticBase):
     """
     Williams, R. J. (1992). Simple statistical gradient-following algorithms
@@ -94,13 +98,15 @@ class REINFORCE(ActorCriticBase):
             batch.state
         )  # (batch_size x state_dim) note that here batch_size = episode length
         return_batch = batch.cum_reward  # (batch_size)
-        policy_propensities = self._actor.get_action_prob(
+        log_probs = self._actor.get_log_action_prob(
             batch.state,
             batch.action,
             batch.curr_available_actions,
             batch.curr_unavailable_actions_mask,
         )  # shape (batch_size)
-        negative_log_probs = -torch.log(policy_propensities + 1e-8)
+        # same floor as log(prob + 1e-8), so that actions which are unavailable
+        # or match no available action keep the loss and its gradients finite
+        negative_log_probs = -log_probs.clamp(min=LOG_PROB_FLOOR)
         if self._use_critic:
             v = self._critic(state_batch).view(-1)  # (batch_size)
             assert return_batch is not None
@@ -29,12 +29,15 @@ class DiscreteContextualBanditReplayBuffer(TensorBasedReplayBuffer):
     - done is not needed, as for contextual bandit, it is always True
     """
 
-    def __init__(self, capacity: int) -> None:
+    def __init__(
+        self, capacity: int, store_device: Optional[torch.device] = None
+    ) -> None:
         super(DiscreteContextualBanditReplayBuffer, self).__init__(
             capacity=capacity,
             has_next_state=False,
             has_next_action=False,
             has_next_available_actions=False,
+            store_device=store_device,
         )
 
     def push(
@@ -57,7 +60,7 @@ class DiscreteContextualBanditReplayBuffer(TensorBasedReplayBuffer):
                 state=self._process_single_state(state),
                 action=action,
                 reward=self._process_single_reward(reward),
-            ).to(self.device)
+            ).to(self.store_device)
         )
 
     def sample(self, batch_size: int) -> TransitionBatch:
@@ -77,4 +77,8 @@ class SingleTransitionReplayBuffer(ReplayBuffer):
         raise Exception("Cannot clear SingleTransitionReplayBuffer")
 
     def __len__(self) -> int:
-        return 1
+        return 0 if self._transition is None else 1
+
+    @property
+    def is_empty(self) -> bool:
+        return self._transition is None
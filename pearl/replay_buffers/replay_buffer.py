@@ -13,6 +13,7 @@ from pearl.api.action import Action
 from pearl.api.action_space import ActionSpace
 from pearl.api.reward import Reward
 from pearl.api.state import SubjectiveState
+from pearl.replay_buffers.transition import TransitionBatch
 
 
 class ReplayBuffer(ABC):
@@ -51,6 +52,20 @@ class ReplayBuffer(ABC):
     def sample(self, batch_size: int) -> object:
         pass
 
+    def sample_batch(self, batch_size: int) -> TransitionBatch:
+        """
+        Samples `batch_size` transitions as a single TransitionBatch, i.e. one
+        batched tensor per field, already on the replay buffer device.
+        Replay buffers whose `sample` returns some other type
+        (for instance a list of transitions) do not support this method.
+        """
+        batch = self.sample(batch_size)
+        if not isinstance(batch, TransitionBatch):
+            raise TypeError(
+                f"{self} samples {type(batch).__name__} instead of TransitionBatch"
+            )
+        return batch
+
     @abstractmethod
     def clear(self) -> None:
         """Empties replay buffer"""
@@ -60,6 +75,15 @@ class ReplayBuffer(ABC):
     def __len__(self) -> int:
         pass
 
+    @property
+    def is_empty(self) -> bool:
+        """
+        Whether the replay buffer holds no transitions.
+        Subclasses for which `__len__` is not cheap should override this
+        with an O(1) check, such as a size counter maintained in `push`.
+        """
+        return len(self) == 0
+
     def __str__(self) -> str:
         return self.__class__.__name__
 
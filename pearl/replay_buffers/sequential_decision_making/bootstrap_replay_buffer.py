@@ -42,6 +42,8 @@ class BootstrapReplayBuffer(FIFOOffPolicyReplayBuffer):
         has_next_action: Whether each piece of experience includes the next action.
         has_next_available:actions: Whether each piece of experience includes the
             next available actions.
+        store_device: Optional device on which experience is stored, defaulting
+            to the device of the replay buffer.
     """
 
     def __init__(
@@ -49,8 +51,9 @@ class BootstrapReplayBuffer(FIFOOffPolicyReplayBuffer):
         capacity: int,
         p: float,
         ensemble_size: int,
+        store_device: Optional[torch.device] = None,
     ) -> None:
-        super().__init__(capacity=capacity)
+        super().__init__(capacity=capacity, store_device=store_device)
         self.p = p
         self.ensemble_size = ensemble_size
 
@@ -67,7 +70,9 @@ class BootstrapReplayBuffer(FIFOOffPolicyReplayBuffer):
         cost: Optional[float] = None,
     ) -> None:
         # sample the bootstrap mask from Bernoulli(p) on each push
-        probs = torch.tensor(self.p).repeat(1, self.ensemble_size)
+        probs = torch.tensor(self.p, device=self.store_device).repeat(
+            1, self.ensemble_size
+        )
         bootstrap_mask = torch.bernoulli(probs)
         (
             curr_available_actions_tensor_with_padding,
@@ -113,7 +118,9 @@ class BootstrapReplayBuffer(FIFOOffPolicyReplayBuffer):
             has_next_available_actions=self._has_next_available_actions,
             has_cost_available=self.has_cost_available,
         )
-        bootstrap_mask_batch = torch.cat([x.bootstrap_mask for x in samples])
+        bootstrap_mask_batch = torch.cat([x.bootstrap_mask for x in samples]).to(
+            self.device
+        )
         return TransitionWithBootstrapMaskBatch(
             state=transition_batch.state,
             action=transition_batch.action,
@@ -7,6 +7,8 @@
 
 from typing import Optional
 
+import torch
+
 from pearl.api.action import Action
 from pearl.api.action_space import ActionSpace
 from pearl.api.reward import Reward
@@ -16,12 +18,18 @@ from pearl.replay_buffers.transition import Transition
 
 
 class FIFOOffPolicyReplayBuffer(TensorBasedReplayBuffer):
-    def __init__(self, capacity: int, has_cost_available: bool = False) -> None:
+    def __init__(
+        self,
+        capacity: int,
+        has_cost_available: bool = False,
+        store_device: Optional[torch.device] = None,
+    ) -> None:
         super(FIFOOffPolicyReplayBuffer, self).__init__(
             capacity=capacity,
             has_next_state=True,
             has_next_action=False,
             has_cost_available=has_cost_available,
+            store_device=store_device,
         )
 
     # TODO: add helper to convert subjective state into tensors
@@ -63,5 +71,5 @@ class FIFOOffPolicyReplayBuffer(TensorBasedReplayBuffer):
                 next_unavailable_actions_mask=next_unavailable_actions_mask,
                 done=self._process_single_done(done),
                 cost=self._process_single_cost(cost),
-            ).to(self.device)
+            ).to(self.store_device)
         )
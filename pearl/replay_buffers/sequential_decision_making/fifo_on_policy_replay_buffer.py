@@ -18,8 +18,12 @@ from pearl.replay_buffers.transition import Transition
 
 
 class FIFOOnPolicyReplayBuffer(TensorBasedReplayBuffer):
-    def __init__(self, capacity: int) -> None:
-        super(FIFOOnPolicyReplayBuffer, self).__init__(capacity)
+    def __init__(
+        self, capacity: int, store_device: Optional[torch.device] = None
+    ) -> None:
+        super(FIFOOnPolicyReplayBuffer, self).__init__(
+            capacity, store_device=store_device
+        )
         # this is used to delay push SARS
         # wait for next action is available and then final push
         # this is designed for single transition for now
@@ -75,7 +79,7 @@ class FIFOOnPolicyReplayBuffer(TensorBasedReplayBuffer):
                     next_available_actions=self.cache.next_available_actions,
                     next_unavailable_actions_mask=self.cache.next_unavailable_actions_mask,
                     done=self.cache.done,
-                ).to(self.device)
+                ).to(self.store_device)
             )
         if not done:
             # save current push into cache
@@ -89,7 +93,7 @@ class FIFOOnPolicyReplayBuffer(TensorBasedReplayBuffer):
                 next_available_actions=next_available_actions_tensor_with_padding,
                 next_unavailable_actions_mask=next_unavailable_actions_mask,
                 done=self._process_single_done(done),
-            ).to(self.device)
+            ).to(self.store_device)
         else:
             # for terminal state, push directly
             self.memory.append(
@@ -105,5 +109,5 @@ class FIFOOnPolicyReplayBuffer(TensorBasedReplayBuffer):
                     next_available_actions=next_available_actions_tensor_with_padding,
                     next_unavailable_actions_mask=next_unavailable_actions_mask,
                     done=self._process_single_done(done),
-                ).to(self.device)
+                ).to(self.store_device)
             )
@@ -7,6 +7,7 @@
 
 from typing import Callable, List, Optional, Tuple
 
+import torch
 from pearl.api.action import Action
 from pearl.api.action_space import ActionSpace
 from pearl.api.reward import Reward
@@ -38,6 +39,8 @@ class HindsightExperienceReplayBuffer(FIFOOffPolicyReplayBuffer):
     done_fn: This is different from paper. Original paper doesn't have it.
              We need it for games which may end earlier.
              If this is not defined, then use done value from original trajectory.
+    store_device: optional device on which transitions are stored,
+                  defaulting to the device of the replay buffer.
     """
 
     # TODO: improve unclear docstring
@@ -48,8 +51,11 @@ class HindsightExperienceReplayBuffer(FIFOOffPolicyReplayBuffer):
         goal_dim: int,
         reward_fn: Callable[[SubjectiveState, Action], Reward],
         done_fn: Optional[Callable[[SubjectiveState, Action], bool]] = None,
+        store_device: Optional[torch.device] = None,
     ) -> None:
-        super(HindsightExperienceReplayBuffer, self).__init__(capacity=capacity)
+        super(HindsightExperienceReplayBuffer, self).__init__(
+            capacity=capacity, store_device=store_device
+        )
         self._goal_dim = goal_dim
         self._reward_fn = reward_fn
         self._done_fn = done_fn
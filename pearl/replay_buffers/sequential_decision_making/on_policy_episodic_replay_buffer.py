@@ -7,6 +7,8 @@
 
 from typing import List, Optional
 
+import torch
+
 from pearl.api.action import Action
 from pearl.api.action_space import ActionSpace
 from pearl.api.reward import Reward
@@ -16,12 +18,18 @@ from pearl.replay_buffers.transition import Transition
 
 
 class OnPolicyEpisodicReplayBuffer(TensorBasedReplayBuffer):
-    def __init__(self, capacity: int, discounted_factor: float = 1.0) -> None:
+    def __init__(
+        self,
+        capacity: int,
+        discounted_factor: float = 1.0,
+        store_device: Optional[torch.device] = None,
+    ) -> None:
         super(OnPolicyEpisodicReplayBuffer, self).__init__(
             capacity=capacity,
             has_next_state=False,
             has_next_action=False,
             has_next_available_actions=False,
+            store_device=store_device,
         )
         # this is used to delay push SARS
         # wait for next action is available and then final push
@@ -63,7 +71,7 @@ class OnPolicyEpisodicReplayBuffer(TensorBasedReplayBuffer):
                 next_available_actions=None,
                 next_unavailable_actions_mask=None,
                 done=self._process_single_done(done),
-            ).to(self.device)
+            ).to(self.store_device)
         )
 
         if done:
@@ -8,7 +8,7 @@
 import random
 
 from collections import deque
-from typing import Deque, List, Optional, Tuple, Union
+from typing import Any, Deque, List, Optional, Tuple, Union
 
 import torch
 
@@ -30,7 +30,15 @@ class TensorBasedReplayBuffer(ReplayBuffer):
         has_next_action: bool = True,
         has_next_available_actions: bool = True,
         has_cost_available: bool = False,
+        store_device: Optional[torch.device] = None,
     ) -> None:
+        """
+        Args:
+            store_device: optional device on which transitions are stored, e.g. the
+                CPU when training on a GPU, to keep GPU memory free for training.
+                Sampled batches are always moved to `device`.
+                If None, transitions are stored on `device`.
+        """
         super(TensorBasedReplayBuffer, self).__init__()
         self.capacity = capacity
         # TODO: we want a unifying transition type
@@ -42,6 +50,7 @@ class TensorBasedReplayBuffer(ReplayBuffer):
         self._has_next_available_actions = has_next_available_actions
         self.has_cost_available = has_cost_available
         self._device: torch.device = get_default_device()
+        self._store_device: Optional[torch.device] = store_device
 
     @property
     def device(self) -> torch.device:
@@ -51,22 +60,72 @@ class TensorBasedReplayBuffer(ReplayBuffer):
     def device(self, value: torch.device) -> None:
         self._device = value
 
+    @property
+    def store_device(self) -> torch.device:
+        """The device on which transitions are stored."""
+        return self._store_device if self._store_device is not None else self._device
+
+    def push_transition(
+        self,
+        state: torch.Tensor,
+        action: torch.Tensor,
+        reward: float,
+        next_state: torch.Tensor,
+        terminated: bool,
+        truncated: bool,
+        cost: Optional[float] = None,
+    ) -> None:
+        """
+        Saves a transition given as tensors, for continuous action spaces, whose
+        callers have no available action spaces to pass to `push`.
+        The transition goes through `push`, so subclass specific processing
+        still applies.
+
+        Args:
+            terminated, truncated: the transition is stored as done if either is set.
+            cost: required if the replay buffer has cost available.
+        """
+        if not self.is_action_continuous:
+            # sampling a discrete action replay buffer requires available actions
+            raise ValueError(
+                f"{self} has a discrete action space, so transitions must be "
+                "pushed with their available actions through `push`"
+            )
+        assert (
+            cost is not None or not self.has_cost_available
+        ), f"{self} has cost available, so a cost must be pushed"
+        self.push(
+            state=state,
+            action=action,
+            reward=reward,
+            next_state=next_state,
+            # pyre-fixme[6]: available actions are not stored without a
+            #  maximum number of actions
+            curr_available_actions=None,
+            # pyre-fixme[6]: available actions are not stored without a
+            #  maximum number of actions
+            next_available_actions=None,
+            done=terminated or truncated,
+            max_number_actions=None,
+            cost=cost,
+        )
+
     def _process_single_state(self, state: SubjectiveState) -> torch.Tensor:
-        return torch.tensor(state, device=self._device).unsqueeze(0)
+        return torch.tensor(state, device=self.store_device).unsqueeze(0)
 
     def _process_single_action(self, action: Action) -> torch.Tensor:
-        return torch.tensor(action, device=self._device).unsqueeze(0)
+        return torch.tensor(action, device=self.store_device).unsqueeze(0)
 
     def _process_single_reward(self, reward: Reward) -> torch.Tensor:
-        return torch.tensor([reward], device=self._device)
+        return torch.tensor([reward], device=self.store_device)
 
     def _process_single_cost(self, cost: Optional[float]) -> Optional[torch.Tensor]:
         if cost is None:
             return None
-        return torch.tensor([cost], device=self._device)
+        return torch.tensor([cost], device=self.store_device)
 
     def _process_single_done(self, done: bool) -> torch.Tensor:
-        return torch.tensor([done], device=self._device)  # (1,)
+        return torch.tensor([done], device=self.store_device)  # (1,)
 
     """
     This function is only used for discrete action space.
@@ -108,7 +167,7 @@ class TensorBasedReplayBuffer(ReplayBuffer):
 
         available_actions_tensor_with_padding = torch.zeros(
             (1, max_number_actions, available_action_space.action_dim),
-            device=self._device,
+            device=self.store_device,
             dtype=torch.float32,
         )  # (1 x action_space_size x action_dim)
         available_actions_tensor = available_action_space.actions_batch
@@ -117,7 +176,7 @@ class TensorBasedReplayBuffer(ReplayBuffer):
         ] = available_actions_tensor
 
         unavailable_actions_mask = torch.zeros(
-            (1, max_number_actions), device=self._device
+            (1, max_number_actions), device=self.store_device
         )  # (1 x action_space_size)
         unavailable_actions_mask[0, available_action_space.n :] = 1
         unavailable_actions_mask = unavailable_actions_mask.bool()
@@ -255,3 +314,65 @@ class TensorBasedReplayBuffer(ReplayBuffer):
             cum_reward=cum_reward_batch,
             cost=cost_batch,
         ).to(self.device)
+
+
+class CacheAwareReuseMixin(TensorBasedReplayBuffer):
+    """
+    A mixin for tensor based replay buffers which reuses a fraction of the
+    transitions of the previous sampled batch in the next one, preferring the
+    ones that were freshly drawn for the previous batch, to improve the
+    memory locality of sampling compared to drawing every transition uniformly
+    at random, as done in AccMER.
+    It must come before a concrete replay buffer class in the bases, e.g.
+    `class MyReplayBuffer(CacheAwareReuseMixin, FIFOOffPolicyReplayBuffer)`,
+    whose `push` is then used unchanged.
+
+    Note that transitions evicted from a full replay buffer shift the positions
+    of the remaining ones, so reused positions may then refer to neighbouring
+    transitions instead of the previously sampled ones.
+    """
+
+    def __init__(self, *args: Any, reuse_ratio: float = 0.5, **kwargs: Any) -> None:
+        """
+        Args:
+            reuse_ratio: the fraction of each sampled batch taken from the
+                previous sampled batch, in [0, 1).
+        """
+        assert 0.0 <= reuse_ratio < 1.0
+        super().__init__(*args, **kwargs)
+        self.reuse_ratio = reuse_ratio
+        self._prev_indices: Optional[List[int]] = None
+
+    def sample(self, batch_size: int) -> TransitionBatch:
+        size = len(self.memory)
+        if batch_size > size:
+            raise ValueError(
+                f"Can't get a batch of size {batch_size} from a replay buffer with"
+                f"only {size} elements"
+            )
+        reused_indices = []
+        if self._prev_indices is not None:
+            # the previous batch starts with its fresh positions, so these are
+            # reused first and each position is only reused for a few batches.
+            # the replay buffer never shrinks until cleared, so they still exist
+            reused_indices = self._prev_indices[: int(self.reuse_ratio * batch_size)]
+        # draw batch_size positions without replacement and drop the reused ones,
+        # which leaves at least the number of fresh positions needed
+        reused_set = set(reused_indices)
+        fresh_indices = [
+            i for i in random.sample(range(size), batch_size) if i not in reused_set
+        ][: batch_size - len(reused_indices)]
+        indices = fresh_indices + reused_indices
+        self._prev_indices = indices
+        return self._create_transition_batch(
+            transitions=[self.memory[i] for i in indices],
+            has_next_state=self._has_next_state,
+            has_next_action=self._has_next_action,
+            is_action_continuous=self._is_action_continuous,
+            has_next_available_actions=self._has_next_available_actions,
+            has_cost_available=self.has_cost_available,
+        )
+
+    def clear(self) -> None:
+        super().clear()
+        self._prev_indices = None
@@ -40,7 +40,7 @@ class RewardConstrainedSafetyModule(SafetyModule):
         self._action_space: Optional[ActionSpace] = None
 
     def learn(self, replay_buffer: ReplayBuffer, policy_learner: PolicyLearner) -> None:
-        if len(replay_buffer) < self.batch_size or len(replay_buffer) == 0:
+        if replay_buffer.is_empty or len(replay_buffer) < self.batch_size:
             return
 
         batch = replay_buffer.sample(self.batch_size)
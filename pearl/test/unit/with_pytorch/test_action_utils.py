@@ -10,8 +10,10 @@ import unittest
 import torch
 from pearl.utils.functional_utils.learning.action_utils import (
     argmax_random_tie_breaks,
+    concatenate_actions_to_state,
     get_model_actions,
 )
+from pearl.utils.instantiations.spaces.discrete_action import DiscreteActionSpace
 
 
 class TestGetAction(unittest.TestCase):
@@ -139,3 +141,37 @@ class TestGetAction(unittest.TestCase):
                 2,
             },
         )
+
+    def test_concatenate_actions_to_state(self) -> None:
+        state_dim = 3
+        action_dim = 2
+        action_count = 4
+        batch_size = 5
+        action_space = DiscreteActionSpace(
+            actions=list(torch.randn(action_count, action_dim))
+        )
+        subjective_state = torch.randn(batch_size, state_dim)
+        feature = concatenate_actions_to_state(
+            subjective_state=subjective_state, action_space=action_space
+        )
+        self.assertEqual(
+            feature.shape, (batch_size, action_count, state_dim + action_dim)
+        )
+        for i in range(batch_size):
+            for j in range(action_count):
+                self.assertTrue(
+                    torch.equal(
+                        feature[i, j],
+                        torch.cat([subjective_state[i], action_space.actions[j]]),
+                    )
+                )
+
+        # single state and state features only
+        feature = concatenate_actions_to_state(
+            subjective_state=subjective_state[0],
+            action_space=action_space,
+            state_features_only=True,
+        )
+        self.assertEqual(feature.shape, (1, action_count, state_dim))
+        self.assertTrue(feature.is_contiguous())
+        self.assertTrue(torch.equal(feature[0, 2], subjective_state[0]))
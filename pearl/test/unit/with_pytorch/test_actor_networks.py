@@ -0,0 +1,190 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import unittest
+
+import torch
+from pearl.neural_networks.sequential_decision_making.actor_networks import (
+    DynamicActionActorNetwork,
+    VanillaActorNetwork,
+)
+from pearl.policy_learners.sequential_decision_making.reinforce import LOG_PROB_FLOOR
+
+
+class TestVanillaActorNetwork(unittest.TestCase):
+    def setUp(self) -> None:
+        self.batch_size = 5
+        self.state_dim = 4
+        self.action_count = 3
+        self.actor = VanillaActorNetwork(
+            input_dim=self.state_dim,
+            hidden_dims=[16, 16],
+            output_dim=self.action_count,
+        )
+        self.state_batch = torch.randn(self.batch_size, self.state_dim)
+        self.action_batch = torch.nn.functional.one_hot(
+            torch.randint(self.action_count, (self.batch_size,)), self.action_count
+        )
+
+    def test_forward_logits(self) -> None:
+        """
+        the action probabilities should be the softmax of the logits
+        """
+        logits = self.actor(self.state_batch, return_logits=True)
+        self.assertTrue(
+            torch.allclose(torch.softmax(logits, dim=-1), self.actor(self.state_batch))
+        )
+
+    def test_get_log_action_prob(self) -> None:
+        """
+        log probabilities should match the log of the action probabilities
+        """
+        action_probs = self.actor.get_action_prob(self.state_batch, self.action_batch)
+        log_action_probs = self.actor.get_log_action_prob(
+            self.state_batch, self.action_batch
+        )
+        self.assertEqual(log_action_probs.shape, (self.batch_size,))
+        self.assertTrue(torch.allclose(log_action_probs, torch.log(action_probs)))
+
+
+class TestDynamicActionActorNetwork(unittest.TestCase):
+    def setUp(self) -> None:
+        self.batch_size = 2
+        self.state_dim = 4
+        self.action_dim = 3
+        self.actor = DynamicActionActorNetwork(
+            input_dim=self.state_dim + self.action_dim, hidden_dims=[16, 16]
+        )
+        self.state_batch = torch.randn(self.batch_size, self.state_dim)
+        # one-hot actions plus an all-zero padding action
+        self.available_actions = torch.cat(
+            [torch.eye(self.action_dim), torch.zeros(1, self.action_dim)]
+        ).repeat(
+            self.batch_size, 1, 1
+        )  # (batch_size, max_number_actions, action_dim)
+        self.unavailable_actions_mask = torch.tensor(
+            [[False, False, False, True], [False, False, True, True]]
+        )  # (batch_size, max_number_actions)
+
+    def test_get_action_prob_with_mask(self) -> None:
+        """
+        the probability of an action should be the one of its match in the policy
+        distribution over available actions
+        """
+        policy_distribution = self.actor.get_policy_distribution(
+            self.state_batch, self.available_actions, self.unavailable_actions_mask
+        )  # (batch_size, max_number_actions)
+        action_idx = torch.tensor([2, 1])
+        action_probs = self.actor.get_action_prob(
+            self.state_batch,
+            self.available_actions[torch.arange(self.batch_size), action_idx],
+            self.available_actions,
+            self.unavailable_actions_mask,
+        )
+        self.assertTrue(
+            torch.allclose(
+                action_probs,
+                policy_distribution[torch.arange(self.batch_size), action_idx],
+            )
+        )
+        self.assertEqual(
+            policy_distribution[self.unavailable_actions_mask].sum().item(), 0.0
+        )
+
+    def test_get_action_prob_unmatched_and_duplicate_actions(self) -> None:
+        """
+        an action matching no available action gets probability 0, and an action
+        matching several available actions gets the sum of their probabilities
+        """
+        # the second element of the batch picks an unavailable action
+        action_batch = self.available_actions[torch.arange(self.batch_size), 2]
+        action_probs = self.actor.get_action_prob(
+            self.state_batch,
+            action_batch,
+            self.available_actions,
+            self.unavailable_actions_mask,
+        )
+        self.assertGreater(action_probs[0].item(), 0.0)
+        self.assertEqual(action_probs[1].item(), 0.0)
+
+        # an action which is not available at all
+        action_probs = self.actor.get_action_prob(
+            self.state_batch,
+            torch.ones(self.batch_size, self.action_dim),
+            self.available_actions,
+        )
+        self.assertTrue(torch.equal(action_probs, torch.zeros(self.batch_size)))
+
+        # the first action is available twice
+        available_actions = self.available_actions.clone()
+        available_actions[:, 3] = available_actions[:, 0]
+        policy_distribution = self.actor.get_policy_distribution(
+            self.state_batch, available_actions
+        )
+        action_probs = self.actor.get_action_prob(
+            self.state_batch, available_actions[:, 0], available_actions
+        )
+        self.assertTrue(
+            torch.allclose(
+                action_probs, policy_distribution[:, 0] + policy_distribution[:, 3]
+            )
+        )
+
+    def test_get_log_action_prob_with_mask(self) -> None:
+        """
+        log probabilities should match the log of the action probabilities,
+        including for unavailable actions
+        """
+        for action_idx in (torch.tensor([2, 1]), torch.tensor([2, 2])):
+            action_batch = self.available_actions[
+                torch.arange(self.batch_size), action_idx
+            ]
+            action_probs = self.actor.get_action_prob(
+                self.state_batch,
+                action_batch,
+                self.available_actions,
+                self.unavailable_actions_mask,
+            )
+            log_action_probs = self.actor.get_log_action_prob(
+                self.state_batch,
+                action_batch,
+                self.available_actions,
+                self.unavailable_actions_mask,
+            )
+            self.assertTrue(torch.allclose(log_action_probs, torch.log(action_probs)))
+        # the last action picked is unavailable for the second element of the batch
+        self.assertEqual(log_action_probs[1].item(), -float("inf"))
+
+    def test_forward_return_logits(self) -> None:
+        """
+        the output of the network is already a logit, whatever `return_logits` is
+        """
+        x = torch.randn(self.batch_size, self.state_dim + self.action_dim)
+        self.assertTrue(torch.equal(self.actor(x, return_logits=True), self.actor(x)))
+
+    def test_get_log_action_prob_unmatched_gradients(self) -> None:
+        """
+        an action matching no available action gets log probability -inf, and the
+        REINFORCE floor keeps the loss and its gradients finite
+        """
+        # the second element of the batch picks an unavailable action
+        action_batch = self.available_actions[torch.arange(self.batch_size), 2]
+        log_action_probs = self.actor.get_log_action_prob(
+            self.state_batch,
+            action_batch,
+            self.available_actions,
+            self.unavailable_actions_mask,
+        )
+        self.assertEqual(log_action_probs[1].item(), -float("inf"))
+        self.assertFalse(torch.isfinite(-log_action_probs.sum()))
+
+        loss = -log_action_probs.clamp(min=LOG_PROB_FLOOR).sum()
+        self.assertTrue(torch.isfinite(loss))
+        loss.backward()
+        for param in self.actor.parameters():
+            assert param.grad is not None
+            self.assertTrue(torch.isfinite(param.grad).all())
@@ -0,0 +1,45 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import unittest
+
+import numpy as np
+import torch
+from pearl.utils.device import as_tensor_on_device
+
+
+class TestAsTensorOnDevice(unittest.TestCase):
+    def test_cpu_pass_through(self) -> None:
+        """
+        tensors already on the CPU are returned as is, and other data is
+        converted like `torch.as_tensor`
+        """
+        device = torch.device("cpu")
+        tensor = torch.randn(3, 4)
+        self.assertIs(as_tensor_on_device(tensor, device), tensor)
+
+        array = np.arange(6, dtype=np.float32).reshape(2, 3)
+        result = as_tensor_on_device(array, device)
+        self.assertEqual(result.device, device)
+        self.assertTrue(torch.equal(result, torch.as_tensor(array)))
+
+        result = as_tensor_on_device([1.0, 2.0], device)
+        self.assertTrue(torch.equal(result, torch.tensor([1.0, 2.0])))
+
+    @unittest.skipIf(not torch.cuda.is_available(), "CUDA is not available")
+    def test_cuda_asynchronous_copy(self) -> None:
+        """
+        data copied asynchronously to a CUDA device holds the host values
+        once the device is synchronized
+        """
+        device = torch.device("cuda")
+        tensor = torch.randn(64, 32)
+        for data in (tensor, tensor.pin_memory(), tensor.numpy(), tensor.tolist()):
+            result = as_tensor_on_device(data, device)
+            torch.cuda.synchronize()
+            self.assertEqual(result.device.type, "cuda")
+            self.assertTrue(torch.equal(result.cpu(), tensor))
@@ -0,0 +1,92 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import unittest
+
+import numpy as np
+import torch
+
+from pearl.utils.instantiations.environments.environments import (
+    FixedNumberOfStepsEnvironment,
+    OneHotObservationsFromDiscrete,
+)
+from pearl.utils.instantiations.environments.gym_environment import GymEnvironment
+
+
+class TestFixedNumberOfStepsEnvironment(unittest.TestCase):
+    def test_step_batch(self) -> None:
+        env = FixedNumberOfStepsEnvironment(number_of_steps=2, number_of_envs=3)
+        actions = np.zeros(3, dtype=np.int64)
+        self.assertTrue(np.array_equal(env.reset_batch(), [0, 0, 0]))
+        action_result = env.step_batch(actions)
+        self.assertTrue(np.all(action_result.terminated))
+        self.assertFalse(np.any(action_result.truncated))
+        self.assertTrue(np.all(action_result.done))
+        action_result = env.step_batch(actions)
+        self.assertTrue(np.array_equal(action_result.observation, [2, 2, 2]))
+        self.assertEqual(action_result.reward.dtype, np.float32)
+        self.assertTrue(np.array_equal(action_result.reward, [2.0, 2.0, 2.0]))
+        self.assertTrue(np.all(action_result.terminated))
+        # the copies are truncated once they took number_of_steps steps
+        self.assertTrue(np.all(action_result.truncated))
+        self.assertEqual(action_result.done.shape, (3,))
+
+        # the returned observation does not alias the counters
+        action_result.observation[0] = 0
+        self.assertTrue(np.array_equal(env.step_batch(actions).observation, [3, 3, 3]))
+        # the scalar step is not affected by the batched one
+        self.assertEqual(env.step(actions[0]).observation, 1)
+
+
+class TestOneHotObservationsFromDiscrete(unittest.TestCase):
+    def test_compute_tensor_observation(self) -> None:
+        env = OneHotObservationsFromDiscrete(GymEnvironment("FrozenLake-v1"))
+        observation, action_space = env.reset(seed=0)
+        self.assertTrue(torch.equal(observation, torch.eye(16)[0]))
+        action_result = env.step(action_space.actions[0])
+        self.assertEqual(action_result.observation.shape, (16,))
+        self.assertEqual(action_result.observation.sum().item(), 1.0)
+
+        # direct calls support both scalar and tensor observations
+        self.assertTrue(
+            torch.equal(env.compute_tensor_observation(3), torch.eye(16)[3])
+        )
+        self.assertTrue(
+            torch.equal(
+                env.compute_tensor_observation(torch.tensor([[1], [3]])),
+                torch.eye(16)[[1, 3]].view(2, 1, 16),
+            )
+        )
+
+    def test_compute_tensor_observation_device(self) -> None:
+        """
+        one-hot observations of tensor observations are on the observations' device
+        """
+        env = OneHotObservationsFromDiscrete(GymEnvironment("FrozenLake-v1"))
+        observation = torch.tensor([1, 3], device="meta")
+        one_hot = env.compute_tensor_observation(observation)
+        self.assertEqual(one_hot.device, observation.device)
+        self.assertEqual(one_hot.shape, (2, 16))
+
+    def test_compute_tensor_observation_type_change(self) -> None:
+        """
+        the conversion specialized on the first observation falls back
+        when a later observation has another type
+        """
+        env = OneHotObservationsFromDiscrete(GymEnvironment("FrozenLake-v1"))
+        self.assertTrue(
+            torch.equal(env._compute_tensor_observation(3), torch.eye(16)[3])
+        )
+        self.assertTrue(
+            torch.equal(
+                env._compute_tensor_observation(torch.tensor([1, 3])),
+                torch.eye(16)[[1, 3]],
+            )
+        )
+        self.assertTrue(
+            torch.equal(env._compute_tensor_observation(2), torch.eye(16)[2])
+        )
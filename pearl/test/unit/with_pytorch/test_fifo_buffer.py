@@ -6,12 +6,27 @@
 #
 
 import unittest
+from typing import Optional
 
 import torch
 
+from pearl.replay_buffers.sequential_decision_making.bootstrap_replay_buffer import (
+    BootstrapReplayBuffer,
+)
+from pearl.replay_buffers.sequential_decision_making.fifo_off_policy_replay_buffer import (
+    FIFOOffPolicyReplayBuffer,
+)
 from pearl.replay_buffers.sequential_decision_making.fifo_on_policy_replay_buffer import (
     FIFOOnPolicyReplayBuffer,
 )
+from pearl.replay_buffers.sequential_decision_making.hindsight_experience_replay_buffer import (  # noqa E501
+    HindsightExperienceReplayBuffer,
+)
+from pearl.replay_buffers.tensor_based_replay_buffer import CacheAwareReuseMixin
+from pearl.replay_buffers.transition import (
+    TransitionBatch,
+    TransitionWithBootstrapMaskBatch,
+)
 from pearl.utils.instantiations.spaces.discrete_action import DiscreteActionSpace
 
 
@@ -109,3 +124,221 @@ class TestFifoBuffer(unittest.TestCase):
         # expect one sample returned
         batch = replay_buffer.sample(1)
         self.assertTrue(batch.done[0])
+
+    def test_sample_batch(self) -> None:
+        """
+        This test is to ensure sample_batch returns a TransitionBatch
+        of the requested size
+        """
+        replay_buffer = FIFOOnPolicyReplayBuffer(self.batch_size * 4)
+        for i in range(self.batch_size):
+            replay_buffer.push(
+                self.states[i],
+                self.actions[i],
+                self.rewards[i],
+                self.next_states[i],
+                self.curr_available_actions,
+                self.next_available_actions,
+                True,
+                self.action_space.n,
+            )
+        batch = replay_buffer.sample_batch(self.batch_size)
+        self.assertIsInstance(batch, TransitionBatch)
+        self.assertEqual(len(batch), self.batch_size)
+        self.assertEqual(batch.state.shape, self.states.shape)
+
+    def test_cache_aware_reuse(self) -> None:
+        """
+        This test is to ensure a replay buffer with CacheAwareReuseMixin reuses
+        the freshly drawn part of the previous sampled batch, without duplicates
+        """
+
+        class ReuseReplayBuffer(CacheAwareReuseMixin, FIFOOffPolicyReplayBuffer):
+            pass
+
+        capacity = self.batch_size * 4
+        replay_buffer = ReuseReplayBuffer(capacity, reuse_ratio=0.5)
+        # each transition is identified by the value of its state
+        for i in range(capacity):
+            replay_buffer.push(
+                torch.full((10,), float(i)),
+                self.actions[0],
+                self.rewards[0],
+                self.next_states[0],
+                self.curr_available_actions,
+                self.next_available_actions,
+                True,
+                self.action_space.n,
+            )
+        batch_size = 4
+        previous_ids = replay_buffer.sample(batch_size).state[:, 0].tolist()
+        reused_sets = []
+        for _ in range(5):
+            ids = replay_buffer.sample(batch_size).state[:, 0].tolist()
+            self.assertEqual(len(ids), batch_size)
+            self.assertEqual(len(set(ids)), batch_size)
+            # the fresh part of the previous batch is reused at the end of this one
+            self.assertEqual(ids[2:], previous_ids[:2])
+            reused_sets.append(set(ids[2:]))
+            previous_ids = ids
+        # the reused transitions rotate instead of staying in every batch
+        for previous_reused, reused in zip(reused_sets, reused_sets[1:]):
+            self.assertTrue(previous_reused.isdisjoint(reused))
+
+        replay_buffer.clear()
+        self.assertIsNone(replay_buffer._prev_indices)
+
+    def test_push_transition(self) -> None:
+        """
+        This test is to ensure transitions pushed with push_transition
+        are sampled back unchanged
+        """
+        replay_buffer = FIFOOffPolicyReplayBuffer(self.batch_size * 4)
+        # no available actions are stored, so discrete action replay buffers
+        # reject the transition at push time rather than failing at sample time
+        with self.assertRaises(ValueError):
+            replay_buffer.push_transition(
+                self.states[0],
+                self.actions[0],
+                self.rewards[0].item(),
+                self.next_states[0],
+                terminated=True,
+                truncated=False,
+            )
+        self.assertTrue(replay_buffer.is_empty)
+        replay_buffer.is_action_continuous = True
+        for i in range(self.batch_size):
+            replay_buffer.push_transition(
+                self.states[i],
+                self.actions[i],
+                self.rewards[i].item(),
+                self.next_states[i],
+                terminated=bool(self.done[i]),
+                truncated=False,
+            )
+        batch = replay_buffer.sample(self.batch_size)
+        # sampling shuffles transitions, so match them by their state
+        order = [
+            int((self.states == state).all(dim=1).nonzero()) for state in batch.state
+        ]
+        self.assertTrue(torch.equal(batch.action, self.actions[order]))
+        self.assertTrue(torch.allclose(batch.reward, self.rewards[order]))
+        assert (batch_next_state := batch.next_state) is not None
+        self.assertTrue(torch.equal(batch_next_state, self.next_states[order]))
+        self.assertTrue(torch.equal(batch.done, self.done[order].bool()))
+
+    def test_push_transition_with_cost(self) -> None:
+        """
+        This test is to ensure push_transition requires and stores a cost
+        when the replay buffer has cost available
+        """
+        replay_buffer = FIFOOffPolicyReplayBuffer(
+            self.batch_size * 4, has_cost_available=True
+        )
+        replay_buffer.is_action_continuous = True
+        with self.assertRaises(AssertionError):
+            replay_buffer.push_transition(
+                self.states[0],
+                self.actions[0],
+                self.rewards[0].item(),
+                self.next_states[0],
+                terminated=True,
+                truncated=False,
+            )
+        replay_buffer.push_transition(
+            self.states[0],
+            self.actions[0],
+            self.rewards[0].item(),
+            self.next_states[0],
+            terminated=False,
+            truncated=True,
+            cost=0.5,
+        )
+        batch = replay_buffer.sample(1)
+        assert (batch_cost := batch.cost) is not None
+        self.assertTrue(torch.equal(batch_cost, torch.tensor([0.5])))
+        self.assertTrue(batch.done[0])
+
+    def test_store_device_defaults_to_device(self) -> None:
+        """
+        This test is to ensure transitions are stored on the replay buffer device
+        when no store device is given
+        """
+        for replay_buffer in (
+            FIFOOffPolicyReplayBuffer(self.batch_size),
+            FIFOOnPolicyReplayBuffer(self.batch_size),
+        ):
+            self.assertEqual(replay_buffer.store_device, replay_buffer.device)
+            replay_buffer.device = torch.device("meta")
+            self.assertEqual(replay_buffer.store_device, torch.device("meta"))
+
+    def _test_store_device(
+        self,
+        store_device: torch.device,
+        device: torch.device,
+        replay_buffer: Optional[FIFOOffPolicyReplayBuffer] = None,
+    ) -> None:
+        if replay_buffer is None:
+            replay_buffer = FIFOOffPolicyReplayBuffer(
+                self.batch_size, store_device=store_device
+            )
+        replay_buffer.device = device
+        self.assertEqual(replay_buffer.store_device, store_device)
+        replay_buffer.push(
+            self.states[0],
+            self.actions[0],
+            self.rewards[0],
+            self.next_states[0],
+            self.curr_available_actions,
+            self.next_available_actions,
+            True,
+            self.action_space.n,
+        )
+        transition = replay_buffer.memory[0]
+        self.assertEqual(transition.state.device.type, store_device.type)
+        self.assertEqual(transition.done.device.type, store_device.type)
+        batch = replay_buffer.sample(1)
+        self.assertEqual(batch.state.device.type, device.type)
+        self.assertEqual(batch.reward.device.type, device.type)
+        assert (batch_mask := batch.curr_unavailable_actions_mask) is not None
+        self.assertEqual(batch_mask.device.type, device.type)
+        if isinstance(batch, TransitionWithBootstrapMaskBatch):
+            self.assertEqual(transition.bootstrap_mask.device.type, store_device.type)
+            self.assertEqual(batch.bootstrap_mask.device.type, device.type)
+        if device.type != "meta":
+            self.assertTrue(torch.equal(batch.state.cpu(), self.states[0].view(1, -1)))
+
+    def test_store_device(self) -> None:
+        """
+        This test is to ensure pushed transitions are stored on the store device
+        and sampled batches are returned on the replay buffer device
+        """
+        self._test_store_device(torch.device("cpu"), torch.device("cpu"))
+
+    def test_store_device_cpu_with_meta_device(self) -> None:
+        """
+        Same as `test_store_device`, with batches sampled to another device than the
+        one transitions are stored on, for each replay buffer accepting a store device
+        """
+        store_device, device = torch.device("cpu"), torch.device("meta")
+        for replay_buffer in (
+            FIFOOffPolicyReplayBuffer(self.batch_size, store_device=store_device),
+            BootstrapReplayBuffer(
+                self.batch_size, p=0.5, ensemble_size=2, store_device=store_device
+            ),
+            HindsightExperienceReplayBuffer(
+                self.batch_size,
+                goal_dim=5,
+                reward_fn=lambda state, action: 0.0,
+                store_device=store_device,
+            ),
+        ):
+            self._test_store_device(store_device, device, replay_buffer)
+
+    @unittest.skipIf(not torch.cuda.is_available(), "CUDA is not available")
+    def test_store_device_cpu_with_cuda_device(self) -> None:
+        """
+        Same as `test_store_device`, with transitions stored on the CPU and
+        batches sampled to a CUDA device
+        """
+        self._test_store_device(torch.device("cpu"), torch.device("cuda"))
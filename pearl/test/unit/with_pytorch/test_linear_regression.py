@@ -67,3 +67,63 @@ class TestLinearRegression(unittest.TestCase):
         states["_b"] = torch.ones((feature_dim + 1,))
         model.load_state_dict(states)
         self.assertEqual(model._b[3], 1)
+
+    def test_batch_update_from_stats(self) -> None:
+        feature_dim = 5
+        num_models = 3
+        batch_size = 20
+        models = [LinearRegression(feature_dim=feature_dim) for _ in range(num_models)]
+        expected_models = [
+            LinearRegression(feature_dim=feature_dim) for _ in range(num_models)
+        ]
+
+        delta_A, delta_b, delta_sum_weight = [], [], []
+        for expected_model in expected_models:
+            feature = torch.randn(batch_size, feature_dim)
+            reward = feature.sum(-1)
+            expected_model.learn_batch(x=feature, y=reward, weight=None)
+            x = LinearRegression.append_ones(feature)
+            delta_A.append(x.t() @ x)
+            delta_b.append(x.t() @ reward)
+            delta_sum_weight.append(torch.tensor(float(batch_size)))
+
+        LinearRegression.batch_update_from_stats(
+            models,
+            delta_A=torch.stack(delta_A),
+            delta_b=torch.stack(delta_b),
+            delta_sum_weight=torch.stack(delta_sum_weight),
+        )
+        for model, expected_model in zip(models, expected_models):
+            self.assertTrue(torch.allclose(model.A, expected_model.A))
+            self.assertTrue(
+                torch.allclose(model._sum_weight, expected_model._sum_weight)
+            )
+            self.assertTrue(
+                torch.allclose(model.coefs, expected_model.coefs, atol=1e-4)
+            )
+        # each model owns its buffers
+        self.assertNotEqual(
+            models[0]._coefs.untyped_storage().data_ptr(),
+            models[1]._coefs.untyped_storage().data_ptr(),
+        )
+        self.assertNotEqual(
+            models[0]._inv_A.untyped_storage().data_ptr(),
+            models[1]._inv_A.untyped_storage().data_ptr(),
+        )
+
+    def test_batch_forward(self) -> None:
+        """
+        batch_forward should match the forward pass of each model on its features
+        """
+        feature_dim = 4
+        models = [LinearRegression(feature_dim=feature_dim) for _ in range(3)]
+        for model in models:
+            x = torch.randn(20, feature_dim)
+            model.learn_batch(x=x, y=torch.randn(20), weight=None)
+        x = torch.randn(15, len(models), feature_dim)
+        expected_values = torch.stack(
+            [model(x[:, i, :]) for i, model in enumerate(models)], dim=-1
+        )
+        values = LinearRegression.batch_forward(models, x)
+        self.assertEqual(values.shape, (15, len(models)))
+        self.assertTrue(torch.allclose(values, expected_values, atol=1e-5))
@@ -20,6 +20,9 @@ class TestTwinCritic(unittest.TestCase):
         self.state_dim = 20
         self.action_dim = 10
         self.batch_size = 128
+        # inputs shared by all tests
+        self.state_batch = torch.randn(self.batch_size, self.state_dim)
+        self.action_batch = torch.randn(self.batch_size, self.action_dim)
 
     def test_twin_critic(self) -> None:
         twin_critics = TwinCritic(
@@ -28,14 +31,68 @@ class TestTwinCritic(unittest.TestCase):
             hidden_dims=[10, 10],
             init_fn=init_weights,
         )
-        state_batch = torch.randn(self.batch_size, self.state_dim)
-        action_batch = torch.randn(self.batch_size, self.action_dim)
         optimizer = torch.optim.AdamW(twin_critics.parameters(), lr=1e-3)
         twin_critic_action_value_update(
-            state_batch=state_batch,
-            action_batch=action_batch,
+            state_batch=self.state_batch,
+            action_batch=self.action_batch,
             expected_target_batch=torch.randn(self.batch_size),
             optimizer=optimizer,
             critic=twin_critics,
         )
-        twin_critics.get_q_values(state_batch, action_batch)
+        twin_critics.get_q_values(self.state_batch, self.action_batch)
+
+    def test_twin_critic_bfloat16_autocast(self) -> None:
+        """
+        twin critics should support bfloat16 autocast for both value computation
+        and optimization, with values close to the float32 ones
+        """
+        twin_critics = TwinCritic(
+            state_dim=self.state_dim,
+            action_dim=self.action_dim,
+            hidden_dims=[10, 10],
+            init_fn=init_weights,
+        )
+        q_1, q_2 = twin_critics.get_q_values(self.state_batch, self.action_batch)
+        with torch.autocast(device_type="cpu", dtype=torch.bfloat16):
+            q_1_bf16, q_2_bf16 = twin_critics.get_q_values(
+                self.state_batch, self.action_batch
+            )
+        self.assertEqual(q_1_bf16.dtype, torch.bfloat16)
+        self.assertEqual(q_2_bf16.dtype, torch.bfloat16)
+        self.assertTrue(torch.allclose(q_1, q_1_bf16.float(), atol=5e-2, rtol=5e-2))
+        self.assertTrue(torch.allclose(q_2, q_2_bf16.float(), atol=5e-2, rtol=5e-2))
+
+        optimizer = torch.optim.AdamW(twin_critics.parameters(), lr=1e-3)
+        with torch.autocast(device_type="cpu", dtype=torch.bfloat16):
+            report = twin_critic_action_value_update(
+                state_batch=self.state_batch,
+                action_batch=self.action_batch,
+                expected_target_batch=torch.randn(self.batch_size),
+                optimizer=optimizer,
+                critic=twin_critics,
+            )
+        self.assertTrue(torch.isfinite(torch.tensor(report["critic_mean_loss"])))
+        # parameters are kept in float32 under autocast
+        for parameter in twin_critics.parameters():
+            self.assertEqual(parameter.dtype, torch.float32)
+
+    def test_twin_critic_compiled(self) -> None:
+        """
+        twin critic values should compile into a single graph (without graph breaks)
+        and match the eager values
+        """
+        twin_critics = TwinCritic(
+            state_dim=self.state_dim,
+            action_dim=self.action_dim,
+            hidden_dims=[10, 10],
+            init_fn=init_weights,
+        )
+        compiled_get_q_values = torch.compile(twin_critics.get_q_values, fullgraph=True)
+        q_1, q_2 = twin_critics.get_q_values(self.state_batch, self.action_batch)
+        # the second call runs the already compiled graph
+        for _ in range(2):
+            compiled_q_1, compiled_q_2 = compiled_get_q_values(
+                self.state_batch, self.action_batch
+            )
+            self.assertTrue(torch.allclose(q_1, compiled_q_1, atol=1e-6))
+            self.assertTrue(torch.allclose(q_2, compiled_q_2, atol=1e-6))
@@ -6,12 +6,20 @@
 #
 
 import unittest
+from typing import List
 
 import torch
-from pearl.neural_networks.common.value_networks import VanillaValueNetwork
+from pearl.neural_networks.common.residual_wrapper import ResidualWrapper
+from pearl.neural_networks.common.utils import mlp_block
+from pearl.neural_networks.common.value_networks import (
+    DuelingQValueNetwork,
+    VanillaQValueNetwork,
+    VanillaValueNetwork,
+)
 
 from pearl.test.utils import create_normal_pdf_training_data
-from torch import optim
+from torch import nn, optim
+from torch._dynamo.utils import counters
 from torch.utils.data import DataLoader, TensorDataset
 
 
@@ -58,3 +66,204 @@ class TestVanillaMlps(unittest.TestCase):
         self.assertTrue(
             sum(losses[1:10]) > sum(losses[-10:])
         )  # loss should decrease over learning steps
+
+    def test_vanilla_mlps_torch_compile(self) -> None:
+        """
+        a compiled network should compute the same values as its eager counterpart
+        """
+        network = VanillaValueNetwork(
+            input_dim=self.x_dim, hidden_dims=[64, 64], output_dim=1
+        )
+        compiled_network = VanillaValueNetwork(
+            input_dim=self.x_dim,
+            hidden_dims=[64, 64],
+            output_dim=1,
+            use_torch_compile=True,
+        )
+        compiled_network.load_state_dict(network.state_dict())
+
+        x_batch, _ = next(iter(self.train_dl))
+        self.assertTrue(
+            torch.allclose(network(x_batch), compiled_network(x_batch), atol=1e-6)
+        )
+
+    def test_q_value_network_torch_compile(self) -> None:
+        """
+        get_q_values of a compiled q value network should go through the compiled
+        mlp block and compute the same values as its eager counterpart
+        """
+        state_dim, action_dim = self.x_dim, 3
+        network = VanillaQValueNetwork(
+            state_dim=state_dim,
+            action_dim=action_dim,
+            hidden_dims=[64, 64],
+            output_dim=1,
+        )
+        compiled_network = VanillaQValueNetwork(
+            state_dim=state_dim,
+            action_dim=action_dim,
+            hidden_dims=[64, 64],
+            output_dim=1,
+            use_torch_compile=True,
+        )
+        compiled_network.load_state_dict(network.state_dict())
+
+        state_batch = torch.rand(self.batch_size, state_dim)
+        action_batch = torch.nn.functional.one_hot(
+            torch.randint(action_dim, (self.batch_size,)), action_dim
+        ).float()
+
+        torch._dynamo.reset()
+        counters.clear()
+        self.assertTrue(
+            torch.allclose(
+                network.get_q_values(state_batch, action_batch),
+                compiled_network.get_q_values(state_batch, action_batch),
+                atol=1e-6,
+            )
+        )
+        self.assertGreater(counters["frames"]["ok"], 0)
+
+    def test_dueling_q_value_network_torch_compile(self) -> None:
+        """
+        get_q_values of a compiled dueling network should go through the compiled
+        forward pass and compute the same values as its eager counterpart
+        """
+        state_dim, action_dim, action_count = self.x_dim, 3, 5
+        network = DuelingQValueNetwork(
+            state_dim=state_dim,
+            action_dim=action_dim,
+            hidden_dims=[64, 64],
+            output_dim=1,
+        )
+        compiled_network = DuelingQValueNetwork(
+            state_dim=state_dim,
+            action_dim=action_dim,
+            hidden_dims=[64, 64],
+            output_dim=1,
+            use_torch_compile=True,
+        )
+        compiled_network.load_state_dict(network.state_dict())
+
+        state_batch = torch.rand(self.batch_size, state_dim)
+        action_batch = torch.nn.functional.one_hot(
+            torch.randint(action_dim, (self.batch_size,)), action_dim
+        ).float()
+        available_actions_batch = torch.rand(self.batch_size, action_count, action_dim)
+
+        torch._dynamo.reset()
+        counters.clear()
+        for curr_available_actions_batch in (None, available_actions_batch):
+            self.assertTrue(
+                torch.allclose(
+                    network.get_q_values(
+                        state_batch, action_batch, curr_available_actions_batch
+                    ),
+                    compiled_network.get_q_values(
+                        state_batch, action_batch, curr_available_actions_batch
+                    ),
+                    atol=1e-6,
+                )
+            )
+        self.assertGreater(counters["frames"]["ok"], 0)
+
+
+class TestMlpBlock(unittest.TestCase):
+    def test_flat_layout(self) -> None:
+        """
+        layers of an mlp_block without skip connections are direct children
+        """
+        model = mlp_block(
+            input_dim=4,
+            hidden_dims=[8, 8],
+            output_dim=1,
+            use_layer_norm=True,
+            dropout_ratio=0.1,
+            use_batch_norm=True,
+        )
+        self.assertEqual(
+            [type(layer) for layer in model],
+            [nn.Linear, nn.LayerNorm, nn.Dropout, nn.ReLU, nn.BatchNorm1d] * 2
+            + [nn.Linear],
+        )
+
+    def test_skip_connections_layout(self) -> None:
+        """
+        only layer groups with equal input and output dimensions are wrapped
+        in a ResidualWrapper
+        """
+        model = mlp_block(
+            input_dim=4,
+            hidden_dims=[8, 8],
+            output_dim=1,
+            last_activation="sigmoid",
+            use_skip_connections=True,
+        )
+        self.assertEqual(
+            [type(layer) for layer in model],
+            [nn.Linear, nn.ReLU, ResidualWrapper, nn.Linear, nn.Sigmoid],
+        )
+        residual_layers = model[2].module
+        self.assertEqual(
+            [type(layer) for layer in residual_layers], [nn.Linear, nn.ReLU]
+        )
+
+    def test_load_nested_state_dict(self) -> None:
+        """
+        state dicts of mlp_blocks with one nn.Sequential per layer group
+        load into the flat layout
+        """
+        for kwargs in (
+            {"hidden_dims": [8, 8], "output_dim": 1},
+            {
+                "hidden_dims": [8, 8],
+                "output_dim": 8,
+                "use_layer_norm": True,
+                "dropout_ratio": 0.1,
+                "use_batch_norm": True,
+                "use_skip_connections": True,
+            },
+            # the old key of a wrapped group is the new key of the previous one
+            {"hidden_dims": [8, 8, 8], "output_dim": 1, "use_skip_connections": True},
+        ):
+            nested_model = _nested_mlp_block(input_dim=4, **kwargs)
+            for param in nested_model.parameters():
+                torch.nn.init.normal_(param)
+            model = mlp_block(input_dim=4, **kwargs)
+            model.load_state_dict(nested_model.state_dict())
+
+            nested_model.eval()
+            model.eval()
+            x = torch.randn(5, 4)
+            self.assertTrue(torch.allclose(model(x), nested_model(x)))
+
+
+def _nested_mlp_block(
+    input_dim: int,
+    hidden_dims: List[int],
+    output_dim: int,
+    use_layer_norm: bool = False,
+    dropout_ratio: float = 0.0,
+    use_batch_norm: bool = False,
+    use_skip_connections: bool = False,
+) -> nn.Module:
+    """
+    mlp_block with its former layout of one nn.Sequential per layer group
+    """
+    dims = [input_dim] + hidden_dims + [output_dim]
+    groups = []
+    for i in range(len(dims) - 1):
+        group = [nn.Linear(dims[i], dims[i + 1])]
+        if i < len(dims) - 2:
+            if use_layer_norm:
+                group.append(nn.LayerNorm(dims[i + 1]))
+            if dropout_ratio > 0:
+                group.append(nn.Dropout(p=dropout_ratio))
+            group.append(nn.ReLU())
+            if use_batch_norm:
+                group.append(nn.BatchNorm1d(dims[i + 1]))
+        group_model = nn.Sequential(*group)
+        if use_skip_connections and dims[i] == dims[i + 1]:
+            group_model = ResidualWrapper(group_model)
+        groups.append(group_model)
+    return nn.Sequential(*groups)
@@ -5,6 +5,8 @@
 # LICENSE file in the root directory of this source tree.
 #
 
+from typing import Any
+
 import torch
 import torch.distributed as dist
 from pearl.utils.functional_utils.python_utils import value_of_first_item
@@ -69,3 +71,18 @@ def get_default_device() -> torch.device:
     specification place their tensors.
     """
     return torch.tensor(0).device
+
+
+def as_tensor_on_device(data: Any, device: torch.device) -> torch.Tensor:
+    """
+    Converts `data` to a tensor on `device`, like `torch.as_tensor(data, device=device)`.
+    When `device` is a CUDA device and the data lives on the host, the data is staged
+    in pinned memory and copied asynchronously, so the host does not wait for the
+    transfer; kernels that later use the tensor are queued on the same stream.
+    """
+    tensor = torch.as_tensor(data)
+    if device.type != "cuda" or tensor.device.type != "cpu":
+        return tensor.to(device)
+    if not tensor.is_pinned():
+        tensor = tensor.pin_memory()
+    return tensor.to(device, non_blocking=True)
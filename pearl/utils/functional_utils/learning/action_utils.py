@@ -113,13 +113,15 @@ def concatenate_actions_to_state(
     action_count = action_space.n
 
     # Expand to (batch_size, action_count, state_dim) and return if `state_features_only`
-    expanded_state = subjective_state.unsqueeze(1).repeat(1, action_count, 1)
+    # `expand` only creates views, so the features are copied exactly once:
+    # by `contiguous` here or by the `cat` below
+    expanded_state = subjective_state.unsqueeze(1).expand(-1, action_count, -1)
     if state_features_only:
-        return expanded_state
+        return expanded_state.contiguous()
 
     # Stack actions and expand to (batch_size, action_count, action_dim)
-    actions = torch.stack(action_space.actions).to(subjective_state.device)
-    expanded_action = actions.unsqueeze(0).repeat(batch_size, 1, 1)
+    actions = action_space.actions_batch.to(subjective_state.device)
+    expanded_action = actions.unsqueeze(0).expand(batch_size, -1, -1)
 
     # (batch_size, action_count, state_dim + action_dim)
     new_feature = torch.cat([expanded_state, expanded_action], dim=2)
@@ -128,4 +130,4 @@ def concatenate_actions_to_state(
         "The shape of the concatenated feature is wrong. Expected "
         f"{(batch_size, action_count, state_dim + action_dim)}, got {new_feature.shape}",
     )
-    return new_feature.to(subjective_state.device)
+    return new_feature
@@ -18,7 +18,7 @@ fbcode/reagent/models/linear_regression.py
 """
 
 import logging
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 import torch
 from pearl.utils.device import is_distribution_enabled
@@ -88,6 +88,7 @@ class LinearRegression(nn.Module):
     def matrix_inv_fallback_pinv(A: torch.Tensor) -> torch.Tensor:
         """
         Try to apply regular matrix inv. If it fails, fallback to pseudo inverse
+        A can also be a batch of matrices of shape (batch_size, d, d)
         """
         try:
             inv_A = torch.linalg.inv(A).contiguous()
@@ -99,7 +100,7 @@ class LinearRegression(nn.Module):
             )
             # switch from `inv` to `pinv`
             # first check if A is Hermitian (symmetric A)
-            A_is_hermitian = torch.allclose(A, A.T, atol=1e-4, rtol=1e-4)
+            A_is_hermitian = torch.allclose(A, A.mT, atol=1e-4, rtol=1e-4)
             # applying hermitian=True saves about 50% computations
             inv_A = torch.linalg.pinv(
                 A,
@@ -139,7 +140,21 @@ class LinearRegression(nn.Module):
         delta_A = torch.matmul(x.t(), x * weight)
         delta_b = torch.matmul(x.t(), y * weight).squeeze()
         delta_sum_weight = weight.sum()
+        self.update_from_stats(delta_A, delta_b, delta_sum_weight)
 
+    def update_from_stats(
+        self,
+        delta_A: torch.Tensor,
+        delta_b: torch.Tensor,
+        delta_sum_weight: torch.Tensor,
+    ) -> None:
+        """
+        Update the model with precomputed sufficient statistics
+        A <- A + delta_A
+        b <- b + delta_b
+        delta_A and delta_b must already include the intercept term,
+        i.e. be computed from inputs with a column of ones appended.
+        """
         if self.distribution_enabled:
             torch.distributed.all_reduce(delta_A)
             torch.distributed.all_reduce(delta_b)
@@ -151,6 +166,70 @@ class LinearRegression(nn.Module):
 
         self.calculate_coefs()  # update coefs after updating A and b
 
+    @staticmethod
+    def batch_update_from_stats(
+        models: List["LinearRegression"],
+        delta_A: torch.Tensor,
+        delta_b: torch.Tensor,
+        delta_sum_weight: torch.Tensor,
+    ) -> None:
+        """
+        Equivalent to calling `update_from_stats` on each model with its slice of
+        the stacked statistics, but with a single all_reduce per statistic and
+        a single batched inversion of A for all models.
+        models: list of LinearRegression models with the same feature_dim
+        delta_A shape: (num_models, feature_dim + 1, feature_dim + 1)
+        delta_b shape: (num_models, feature_dim + 1)
+        delta_sum_weight shape: (num_models,)
+        """
+        if len(models) == 0:
+            return
+        if any(model.distribution_enabled for model in models):
+            torch.distributed.all_reduce(delta_A)
+            torch.distributed.all_reduce(delta_b)
+            torch.distributed.all_reduce(delta_sum_weight)
+
+        device = models[0]._A.device
+        torch._foreach_add_(
+            [model._A for model in models], list(delta_A.to(device).unbind(0))
+        )
+        torch._foreach_add_(
+            [model._b for model in models], list(delta_b.to(device).unbind(0))
+        )
+        torch._foreach_add_(
+            [model._sum_weight for model in models],
+            list(delta_sum_weight.to(device).view(-1, 1).unbind(0)),
+        )
+
+        # update coefs of all models after updating A and b
+        inv_A = LinearRegression.matrix_inv_fallback_pinv(
+            torch.stack([model._A for model in models])
+        )  # (num_models, feature_dim + 1, feature_dim + 1)
+        b = torch.stack([model._b for model in models])  # (num_models, feature_dim + 1)
+        coefs = torch.matmul(inv_A, b.unsqueeze(-1)).squeeze(-1)
+        # cloned so that the buffers of each model do not alias one stacked tensor
+        for model, model_inv_A, model_coefs in zip(models, inv_A, coefs):
+            model._inv_A = model_inv_A.clone()
+            model._coefs = model_coefs.clone()
+
+    @staticmethod
+    def batch_forward(
+        models: List["LinearRegression"], features: torch.Tensor
+    ) -> torch.Tensor:
+        """
+        Equivalent to calling each model on its slice of the features, but with
+        a single batched product of the stacked coefficients of all models.
+        models: list of LinearRegression models with the same feature_dim
+        features shape: (batch_size, num_models, feature_dim)
+        return will be shape(batch_size, num_models)
+        """
+        coefs = torch.stack(
+            [model.coefs for model in models]
+        )  # (num_models, feature_dim + 1)
+        return torch.einsum(
+            "bmi,mi->bm", LinearRegression.append_ones(features), coefs
+        )  # (batch_size, num_models)
+
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         """
         x could be a single vector or a batch
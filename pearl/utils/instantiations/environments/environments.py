@@ -5,8 +5,9 @@
 # LICENSE file in the root directory of this source tree.
 #
 
+import dataclasses
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from pearl.api.observation import Observation
 from pearl.api.space import Space
@@ -21,20 +22,45 @@ except ModuleNotFoundError:
 
 import numpy as np
 import torch
-import torch.nn.functional as F
 from pearl.api.action import Action
 from pearl.api.action_result import ActionResult
 from pearl.api.action_space import ActionSpace
 from pearl.api.environment import Environment
 
 
+@dataclasses.dataclass
+class ActionResultBatch:
+    """
+    The results of a step of several parallel copies of an environment,
+    with one entry per copy in each array.
+    """
+
+    observation: np.ndarray
+    reward: np.ndarray
+    terminated: np.ndarray
+    truncated: np.ndarray
+    info: Dict[str, Any]
+
+    @property
+    def done(self) -> np.ndarray:
+        return np.logical_or(self.terminated, self.truncated)
+
+
 class FixedNumberOfStepsEnvironment(Environment):
-    def __init__(self, number_of_steps: int = 100) -> None:
+    def __init__(self, number_of_steps: int = 100, number_of_envs: int = 1) -> None:
+        """
+        Args:
+            number_of_steps: the number of steps of the environment.
+            number_of_envs: the number of parallel copies of the environment
+                advanced together by `step_batch`.
+        """
         self.number_of_steps_so_far = 0
         self.number_of_steps: int = number_of_steps
         self._action_space = DiscreteActionSpace(
             [torch.tensor(True), torch.tensor(False)]
         )
+        # step counters of the parallel copies, only used by `step_batch`
+        self._counters: np.ndarray = np.zeros(number_of_envs, dtype=np.int64)
 
     def step(self, action: Action) -> ActionResult:
         self.number_of_steps_so_far += 1
@@ -46,6 +72,28 @@ class FixedNumberOfStepsEnvironment(Environment):
             info={},
         )
 
+    def step_batch(self, actions: np.ndarray) -> ActionResultBatch:
+        """
+        Advances all parallel copies of the environment with a single vectorized
+        update, for use with vectorized environment wrappers.
+        As in `step`, every step terminates, and a copy is also truncated once it
+        has taken `number_of_steps` steps.
+
+        Args:
+            actions: the actions taken in each copy, of shape (number_of_envs,).
+        Returns:
+            An ActionResultBatch whose arrays have shape (number_of_envs,).
+        """
+        assert len(actions) == len(self._counters)
+        self._counters += 1
+        return ActionResultBatch(
+            observation=self._counters.copy(),
+            reward=self._counters.astype(np.float32),
+            terminated=np.ones(len(self._counters), dtype=bool),
+            truncated=self._counters >= self.number_of_steps,
+            info={},
+        )
+
     def render(self) -> None:
         print(self.number_of_steps_so_far)
 
@@ -54,7 +102,18 @@ class FixedNumberOfStepsEnvironment(Environment):
         return self._action_space
 
     def reset(self, seed: Optional[int] = None) -> Tuple[Observation, ActionSpace]:
-        return self.number_of_steps_so_far, self.action_space
+        return self.number_of_steps_so_far, self._action_space
+
+    def reset_batch(self, seed: Optional[int] = None) -> np.ndarray:
+        """
+        Counterpart of `reset` for the parallel copies advanced by `step_batch`.
+        Only the observations are returned, since the action space is the same
+        for all copies and is available as `action_space`.
+
+        Returns:
+            The observations of all copies, of shape (number_of_envs,).
+        """
+        return self._counters.copy()
 
     def __str__(self) -> str:
         return type(self).__name__
@@ -73,6 +132,11 @@ class BoxObservationsEnvironmentBase(Environment, ABC):
     ) -> None:
         self.base_environment = base_environment
         self.observation_space: Space = self.make_observation_space(base_environment)
+        # bound once here, so that each step does not resolve them again
+        self._base_step: Callable[[Action], ActionResult] = base_environment.step
+        self._compute_tensor_observation: Callable[[Observation], torch.Tensor] = (
+            self.compute_tensor_observation
+        )
 
     @staticmethod
     @abstractmethod
@@ -88,15 +152,22 @@ class BoxObservationsEnvironmentBase(Environment, ABC):
         return self.base_environment.action_space
 
     def step(self, action: Action) -> ActionResult:
-        action_result = self.base_environment.step(action)
-        action_result.observation = self.compute_tensor_observation(
-            action_result.observation
+        action_result = self._base_step(action)
+        # a new result is returned instead of mutating the one of the base environment,
+        # built directly since dataclasses.replace is much slower per step
+        return ActionResult(
+            observation=self._compute_tensor_observation(action_result.observation),
+            reward=action_result.reward,
+            terminated=action_result.terminated,
+            truncated=action_result.truncated,
+            info=action_result.info,
+            cost=action_result.cost,
+            available_action_space=action_result.available_action_space,
         )
-        return action_result
 
     def reset(self, seed: Optional[int] = None) -> Tuple[Observation, ActionSpace]:
         observation, action_space = self.base_environment.reset(seed=seed)
-        return self.compute_tensor_observation(observation), action_space
+        return self._compute_tensor_observation(observation), action_space
 
     def __str__(self) -> str:
         return f"{self.short_description} from {self.base_environment}"
@@ -120,16 +191,24 @@ class BoxObservationsFromDiscrete(BoxObservationsEnvironmentBase):
 
     @staticmethod
     def make_observation_space(base_environment: Environment) -> Space:
-        low_action = np.array([0])
         # pyre-fixme: need to add this property in Environment
         # and implement it in all concrete subclasses
         assert isinstance(base_environment.observation_space, DiscreteSpace)
-        high_action = np.array([base_environment.observation_space.n - 1])
+        # scalar bounds are broadcast by Box into its own float32 arrays,
+        # so no intermediate int64 arrays are needed
         # pyre-fixme: returning Gym Box but needs to return Pearl Space
-        return gym.spaces.Box(low=low_action, high=high_action, shape=(1,))
+        return gym.spaces.Box(
+            low=0,
+            high=base_environment.observation_space.n - 1,
+            shape=(1,),
+            dtype=np.float32,
+        )
 
     def compute_tensor_observation(self, observation: Observation) -> torch.Tensor:
-        return torch.tensor([observation])
+        # torch.full skips the list boxing and data inference of torch.tensor([...]).
+        # A fresh tensor is returned on purpose: the agent and replay buffers keep
+        # references to observations, so reusing a buffer would overwrite them.
+        return torch.full((1,), observation)
 
 
 class OneHotObservationsFromDiscrete(BoxObservationsEnvironmentBase):
@@ -143,6 +222,19 @@ class OneHotObservationsFromDiscrete(BoxObservationsEnvironmentBase):
 
     def __init__(self, base_environment: Environment) -> None:
         super(OneHotObservationsFromDiscrete, self).__init__(base_environment)
+        # pyre-fixme: need to add this property in Environment
+        # and implement it in all concrete subclasses
+        assert isinstance(self.base_environment.observation_space, DiscreteSpace)
+        self._n: int = self.base_environment.observation_space.n
+        # one-hot vectors are rows of the identity matrix, built once here
+        # so that each step is a row gather instead of a one_hot scatter
+        self._eye: torch.Tensor = torch.eye(self._n, dtype=torch.float32)
+        # copies of the identity matrix on the devices of tensor observations
+        self._eyes: Dict[torch.device, torch.Tensor] = {self._eye.device: self._eye}
+        # the type of observations of an environment usually does not change between
+        # steps, so step and reset use a conversion specialized for it on first use,
+        # which specializes again if a later observation has the other type
+        self._compute_tensor_observation = self._specialize_tensor_observation
 
     @staticmethod
     def make_observation_space(base_environment: Environment) -> Space:
@@ -150,23 +242,47 @@ class OneHotObservationsFromDiscrete(BoxObservationsEnvironmentBase):
         # and implement it in all concrete subclasses
         assert isinstance(base_environment.observation_space, DiscreteSpace)
         n = base_environment.observation_space.n
-        low = np.full((n,), 0)
-        high = np.full((n,), 1)
+        # scalar bounds are broadcast by Box into its own float32 arrays,
+        # so no intermediate n-sized int64 arrays are needed
         # pyre-fixme: returning Gym Box but needs to return Pearl Space
-        return gym.spaces.Box(low=low, high=high, shape=(n,))
+        return gym.spaces.Box(low=0, high=1, shape=(n,), dtype=np.float32)
 
     def compute_tensor_observation(self, observation: Observation) -> torch.Tensor:
+        return self._tensor_observation_function(observation)(observation)
+
+    def _tensor_observation_function(
+        self, observation: Observation
+    ) -> Callable[[Observation], torch.Tensor]:
         if isinstance(observation, torch.Tensor):
-            observation_tensor = observation
-        else:
-            observation_tensor = torch.tensor(observation)
-        # pyre-fixme: need to add this property in Environment
-        # and implement it in all concrete subclasses
-        assert isinstance(self.base_environment.observation_space, DiscreteSpace)
-        return F.one_hot(
-            observation_tensor,
-            self.base_environment.observation_space.n,
+            return self._tensor_observation_from_tensor
+        # scalar observations (the common case for gym environments)
+        return self._tensor_observation_from_scalar
+
+    def _specialize_tensor_observation(self, observation: Observation) -> torch.Tensor:
+        self._compute_tensor_observation = self._tensor_observation_function(
+            observation
         )
+        return self._compute_tensor_observation(observation)
+
+    def _tensor_observation_from_scalar(self, observation: Observation) -> torch.Tensor:
+        if isinstance(observation, torch.Tensor):
+            return self._specialize_tensor_observation(observation)
+        # read directly, without first being converted to a tensor, and copied
+        # so that observations never alias self._eye
+        # pyre-fixme[6]: discrete observations are integers
+        return self._eye[int(observation)].clone()
+
+    def _tensor_observation_from_tensor(self, observation: Observation) -> torch.Tensor:
+        if not isinstance(observation, torch.Tensor):
+            return self._specialize_tensor_observation(observation)
+        # pyre-fixme[16]: only bound for tensor observations
+        device = observation.device
+        eye = self._eyes.get(device)
+        if eye is None:
+            eye = self._eyes[device] = self._eye.to(device)
+        one_hot = eye.index_select(0, observation.long().view(-1))
+        # pyre-fixme[16]: only bound for tensor observations
+        return one_hot.view(*observation.shape, -1)
 
     @property
     def short_description(self) -> str: